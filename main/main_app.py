@@ -122,6 +122,13 @@ class MainApp(QObject):
 
     def _on_about_to_quit(self):
         """应用退出前收尾"""
+        try:
+            # 关闭翻译窗口并释放 DeepL 连接池中的长连接
+            from translation import TranslationManager
+            TranslationManager.cleanup()
+        except Exception as e:
+            log_exception(e, "清理翻译服务")
+
         try:
             if hasattr(self, "_logger") and self._logger:
                 self._logger.close()
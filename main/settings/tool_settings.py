@@ -20,6 +20,7 @@ from typing import Dict, Any, Optional
 from PySide6.QtCore import QSettings, Signal, QObject
 from PySide6.QtGui import QColor
 from core.constants import DEFAULT_FONT_FAMILY
+from core.logger import log_info
 
 
 class ToolSettings:
@@ -200,6 +201,7 @@ class ToolSettingsManager(QObject):
         "magnifier_zoom": 4.0,                 # 放大镜默认倍率（1.0 ~ 10.0）
         "magnifier_zoom_min": 2.0,             # 放大镜最小倍率
         "magnifier_zoom_max": 10.0,            # 放大镜最大倍率
+        "native_file_dialog": False,           # 选择文件夹时使用系统原生对话框（默认用 Qt 内置对话框，打开更快）
         
         # ==================== 钉图设置（在"其他"页面或独立页面） ====================
         "pin_auto_toolbar": False,              # 钉图自动显示工具栏
@@ -420,7 +422,7 @@ class ToolSettingsManager(QObject):
             
             self.qsettings.setValue(setting_key, default_value)
         
-        print("[OK] [设置] 应用设置已重置为默认值")
+        log_info("应用设置已重置为默认值", "Settings")
     
     def get_app_setting(self, key: str, default=None) -> Any:
         """
@@ -443,7 +445,10 @@ class ToolSettingsManager(QObject):
         else:
             setting_key = f"app/{key}"
         
-        # 根据默认值的类型确定返回类型
+        return self._read_typed(setting_key, default)
+
+    def _read_typed(self, setting_key: str, default=None) -> Any:
+        """按默认值的类型读取 QSettings 值（default 为 None 时不做类型转换）"""
         if default is not None:
             if isinstance(default, bool):
                 return self.qsettings.value(setting_key, default, type=bool)
@@ -455,6 +460,37 @@ class ToolSettingsManager(QObject):
                 return self.qsettings.value(setting_key, default, type=str)
         else:
             return self.qsettings.value(setting_key, default)
+
+    def get_app_settings(self, keys: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        批量获取 app/ 分组下的应用设置（在同一个 beginGroup 内读取）
+
+        设置页构建时一次取出本页用到的全部键，代替逐项调用 get_app_setting
+        （每次都要拼接完整键名并单独查询 QSettings）。
+
+        Args:
+            keys: {设置键名: 默认值}，默认值为 None 时使用 APP_DEFAULT_SETTINGS 中的默认值；
+                  pin_ 开头的键不在 app/ 分组内，会回退到 get_app_setting 逐个读取
+
+        Returns:
+            {设置键名: 设置值}
+        """
+        result = {}
+        pin_keys = []
+        self.qsettings.beginGroup("app")
+        try:
+            for key, default in keys.items():
+                if key.startswith("pin_"):
+                    pin_keys.append(key)
+                    continue
+                if default is None:
+                    default = self.APP_DEFAULT_SETTINGS.get(key)
+                result[key] = self._read_typed(key, default)
+        finally:
+            self.qsettings.endGroup()
+        for key in pin_keys:
+            result[key] = self.get_app_setting(key, keys[key])
+        return result
     
     def set_app_setting(self, key: str, value: Any):
         """
@@ -476,7 +512,7 @@ class ToolSettingsManager(QObject):
         """重置所有设置（工具设置 + 应用设置）为默认值"""
         self.reset_all()           # 重置工具设置
         self.reset_app_settings()  # 重置应用设置
-        print("[OK] [设置] 所有设置已重置为默认值")
+        log_info("所有设置已重置为默认值", "Settings")
     
     def get_color(self, tool_id: str) -> QColor:
         """获取工具的颜色（返回 QColor 对象）"""
@@ -1020,12 +1056,12 @@ class ToolSettingsManager(QObject):
         """
         # 首次运行：强制显示
         if self.is_first_run():
-            print("[启动] 检测到首次运行，将自动打开设置窗口")
+            log_info("检测到首次运行，将自动打开设置窗口", "Startup")
             return True
         
         # 非首次运行：读取用户设置
         show = self.get_show_main_window()
-        print(f"[启动] 根据用户设置：{'显示主窗口' if show else '后台启动'}")
+        log_info(f"根据用户设置：{'显示主窗口' if show else '后台启动'}", "Startup")
         return show
 
 
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+DeepLService 连接池与译文缓存单元测试
+
+用假的 HTTPSConnection 替换网络层，验证：
+- 连续翻译复用同一连接
+- 复用的空闲连接失效时换新连接重试
+- HTTP 错误码映射为错误信息
+- 请求体为 UTF-8 JSON
+- 相同请求命中译文缓存，过期后重新请求
+- 切换密钥或 Free/Pro 接口后不返回旧凭据下的缓存
+"""
+import http.client
+import json
+import urllib.request
+
+import pytest
+
+from translation.deepl_service import DeepLService
+
+
+class FakeResponse:
+    def __init__(self, status=200, reason="OK", payload=None, will_close=False):
+        self.status = status
+        self.reason = reason
+        self.will_close = will_close
+        self._body = json.dumps(payload or {
+            "translations": [{"text": "你好", "detected_source_language": "EN"}]
+        }).encode("utf-8")
+
+    def read(self):
+        return self._body
+
+
+class FakeConnection:
+    instances = []
+    responses = []
+
+    def __init__(self, host, port=None, timeout=None):
+        self.host = host
+        self.timeout = timeout
+        self.sock = None
+        self.requests = 0
+        self.closed = False
+        self.fail_next = None
+        FakeConnection.instances.append(self)
+
+    def request(self, method, path, body=None, headers=None):
+        if self.fail_next is not None:
+            error, self.fail_next = self.fail_next, None
+            raise error
+        self.sock = FakeSocket()
+        self.requests += 1
+        self.last_body = body
+        self.last_headers = headers
+
+    def getresponse(self):
+        return FakeConnection.responses.pop(0) if FakeConnection.responses else FakeResponse()
+
+    def close(self):
+        self.closed = True
+        self.sock = None
+
+
+class FakeSocket:
+    def settimeout(self, timeout):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_network(monkeypatch):
+    FakeConnection.instances = []
+    FakeConnection.responses = []
+    monkeypatch.setattr(http.client, "HTTPSConnection", FakeConnection)
+    monkeypatch.setattr(urllib.request, "getproxies", lambda: {})
+    DeepLService.close()
+    DeepLService.clear_cache()
+    yield
+    DeepLService.close()
+    DeepLService.clear_cache()
+
+
+class TestConnectionPool:
+    """连接复用与失效连接替换"""
+
+    def test_consecutive_translations_reuse_connection(self):
+        """连续翻译复用同一连接"""
+        service = DeepLService("key")
+
+        first = service.translate("Hello")
+        second = service.translate("World")
+
+        assert first["success"] and second["success"]
+        assert first["translated_text"] == "你好"
+        assert len(FakeConnection.instances) == 1
+        assert FakeConnection.instances[0].requests == 2
+
+    def test_stale_idle_connection_is_replaced(self):
+        """复用的空闲连接已被服务端关闭时换新连接重试"""
+        service = DeepLService("key")
+        service.translate("Hello")
+        stale = FakeConnection.instances[0]
+        stale.fail_next = http.client.RemoteDisconnected("closed by server")
+
+        result = service.translate("World")
+
+        assert result["success"]
+        assert stale.closed
+        assert len(FakeConnection.instances) == 2
+
+    def test_server_close_header_drops_connection(self):
+        """服务端要求关闭的连接不放回连接池"""
+        FakeConnection.responses = [FakeResponse(will_close=True)]
+        service = DeepLService("key")
+
+        service.translate("Hello")
+        service.translate("World")
+
+        assert FakeConnection.instances[0].closed
+        assert len(FakeConnection.instances) == 2
+
+
+class TestRequest:
+    """请求体与错误映射"""
+
+    def test_request_body_is_utf8_json(self):
+        """请求体为 UTF-8 JSON，text 为数组、preserve_formatting 为布尔值"""
+        DeepLService("key").translate("こんにちは", target_lang="zh", preserve_formatting=False)
+
+        conn = FakeConnection.instances[0]
+        assert conn.last_headers["Content-Type"] == "application/json"
+        assert "こんにちは".encode("utf-8") in conn.last_body
+        assert json.loads(conn.last_body) == {
+            "text": ["こんにちは"],
+            "target_lang": "ZH",
+            "split_sentences": "1",
+            "preserve_formatting": False,
+        }
+
+    def test_http_error_is_mapped(self):
+        """HTTP 错误码映射为错误信息"""
+        FakeConnection.responses = [FakeResponse(status=403, reason="Forbidden", payload={})]
+
+        result = DeepLService("key").translate("Hello")
+
+        assert not result["success"]
+        assert result["error"] == "API key permission denied"
+
+
+class TestResultCache:
+    """译文缓存"""
+
+    def test_repeated_translation_hits_cache(self):
+        """相同请求命中缓存，返回副本不受调用方修改影响"""
+        service = DeepLService("key")
+
+        first = service.translate("Hello", target_lang="zh")
+        first["translated_text"] = "modified by caller"
+        second = service.translate("Hello", target_lang="ZH")
+        other_lang = service.translate("Hello", target_lang="JA")
+
+        assert second["translated_text"] == "你好"
+        assert FakeConnection.instances[0].requests == 2
+        assert other_lang["success"]
+
+    def test_expired_cache_entry_is_refetched(self, monkeypatch):
+        """过期的缓存项重新请求"""
+        service = DeepLService("key")
+        service.translate("Hello")
+        monkeypatch.setattr(DeepLService, "_CACHE_TTL", 0.0)
+
+        service.translate("Hello")
+
+        assert FakeConnection.instances[0].requests == 2
+
+    def test_cache_is_scoped_to_credentials(self):
+        """缓存按密钥和 Free/Pro 接口区分"""
+        DeepLService("key-a").translate("Hello")
+
+        DeepLService("key-b").translate("Hello")
+        DeepLService("key-a", use_pro=True).translate("Hello")
+        DeepLService("key-a").translate("Hello")
+
+        assert sum(conn.requests for conn in FakeConnection.instances) == 3
+
+    def test_failed_translation_is_not_cached(self):
+        """失败结果不缓存"""
+        FakeConnection.responses = [FakeResponse(status=503, reason="Unavailable", payload={})]
+        service = DeepLService("key")
+
+        assert not service.translate("Hello")["success"]
+        assert service.translate("Hello")["success"]
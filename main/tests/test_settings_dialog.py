@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+设置对话框回归测试
+
+覆盖页面按需构建相关的行为：
+- 初始只构建首页，其余为占位控件
+- 导航时构建目标页并替换占位
+- 替换占位后当前页保持不变，不会停在空白占位上
+- 保存时未构建的页面不会覆盖已有配置
+- 按需构建的页面不会被误判为未保存变更
+- 显示或导航后只在空闲时预构建导航中的下一页
+- 回填应用内快捷键时不触发冲突检测
+- 界面语言只在实际变更时写入并重新加载
+- 显式选择与系统语言相同的翻译目标语言时仍会保存
+- 文件夹选择框默认用 Qt 内置对话框，开发者页开关可切回系统原生对话框
+"""
+
+import pytest
+
+from settings.tool_settings import ToolSettingsManager
+from ui.settings_ui import page_hotkey
+from ui.settings_ui import dialog as dialog_module
+from ui.settings_ui.dialog import SettingsDialog
+
+
+@pytest.fixture
+def dialog(qapp, tmp_settings):
+    manager = ToolSettingsManager(qsettings=tmp_settings)
+    dlg = SettingsDialog(manager)
+    yield dlg
+    dlg._skip_unsaved_close_prompt = True
+    dlg.close()
+    dlg.deleteLater()
+
+
+class TestLazyPages:
+    """页面按需构建"""
+
+    def test_only_first_page_built_initially(self, dialog):
+        """初始只构建首页，且当前显示的是首页而非占位"""
+        assert dialog._pages[0] is not None
+        assert all(page is None for page in dialog._pages[1:])
+        assert dialog.content_stack.count() == len(dialog._pages)
+        assert dialog.content_stack.currentWidget() is dialog._pages[0]
+        assert not hasattr(dialog, "deepl_api_key_input")
+
+    def test_navigation_builds_page_in_place(self, dialog):
+        """导航时在原位置构建页面，再次导航不重复构建"""
+        dialog._on_nav_changed(4)
+
+        page = dialog._pages[4]
+        assert page is not None
+        assert dialog.content_stack.widget(4) is page
+        assert dialog.content_stack.currentIndex() == 4
+        assert dialog.content_stack.count() == len(dialog._pages)
+
+        # 再次导航不会重复构建
+        dialog._on_nav_changed(0)
+        dialog._on_nav_changed(4)
+        assert dialog._pages[4] is page
+
+    def test_building_other_pages_keeps_current_page(self, dialog):
+        """后台构建其他页面时，insert/remove 不能把当前页挪到空白占位上"""
+        for index in (1, 3, 2, len(dialog._pages) - 1):
+            dialog._ensure_page(index)
+            assert dialog.content_stack.currentWidget() is dialog._pages[0]
+            assert dialog.content_stack.currentIndex() == 0
+
+    def test_building_current_placeholder_shows_page(self, dialog):
+        """当前显示的正是占位时，构建后切换到新页面"""
+        dialog.content_stack.setCurrentIndex(3)
+
+        page = dialog._ensure_page(3)
+
+        assert dialog.content_stack.currentWidget() is page
+        assert dialog.content_stack.currentIndex() == 3
+
+    def test_only_next_page_prebuilt_after_show(self, dialog, qapp):
+        """显示后空闲时只预构建下一页，且不改变当前页"""
+        dialog.show()
+        for _ in range(len(dialog._pages) * 2):
+            qapp.processEvents()
+
+        assert [i for i, page in enumerate(dialog._pages) if page is not None] == [0, 1]
+        assert dialog.content_stack.currentIndex() == 0
+        assert not dialog._has_unsaved_changes()
+
+    def test_navigation_prebuilds_following_nav_page(self, dialog, qapp):
+        """导航后预构建导航中的下一页，跳过没有导航项的开发者页"""
+        dialog.show()
+        qapp.processEvents()
+
+        dialog._on_nav_changed(6)
+        for _ in range(len(dialog._pages) * 2):
+            qapp.processEvents()
+
+        assert dialog._pages[8] is not None
+        assert dialog._pages[7] is None
+        assert all(dialog._pages[i] is None for i in (2, 3, 4, 5))
+
+
+class TestAccept:
+    """保存与未保存变更检测"""
+
+    def test_accept_skips_unbuilt_pages(self, dialog):
+        """未构建的页面不会用控件默认值覆盖已有配置"""
+        manager = dialog.config_manager
+        manager.set_deepl_api_key("existing-key")
+        manager.set_clipboard_history_limit(42)
+
+        dialog.accept()
+
+        assert dialog._pages[4] is None
+        assert manager.get_deepl_api_key() == "existing-key"
+        assert manager.get_clipboard_history_limit() == 42
+
+    def test_lazy_page_not_reported_as_unsaved(self, dialog, qapp):
+        """按需构建的页面补入快照，不被误判为已修改"""
+        dialog.show()
+        qapp.processEvents()
+
+        dialog._on_nav_changed(5)
+        assert not dialog._has_unsaved_changes()
+
+        dialog.log_retention_spinbox.setValue(dialog.log_retention_spinbox.value() + 1)
+        assert dialog._has_unsaved_changes()
+
+    def test_accept_reloads_language_only_when_changed(self, dialog, monkeypatch):
+        """界面语言只在实际变更时写入并重新加载"""
+        loaded = []
+        monkeypatch.setattr(dialog_module.I18nManager, "load_language", loaded.append)
+        for index in range(len(dialog._pages)):
+            dialog._ensure_page(index)
+
+        dialog.accept()
+        assert loaded == []
+
+        combo = dialog.language_combo
+        new_index = next(i for i in range(combo.count()) if combo.itemData(i) != dialog._initial_lang)
+        combo.setCurrentIndex(new_index)
+        dialog.accept()
+
+        new_lang = combo.itemData(new_index)
+        assert loaded == [new_lang]
+        assert dialog.config_manager.get_app_setting("language", "ja") == new_lang
+
+
+class TestRefresh:
+    """refresh_settings 回填"""
+
+    def test_refresh_swapped_shortcuts_does_not_prompt(self, dialog, monkeypatch):
+        """回填互换的应用内快捷键时不触发冲突确认"""
+        prompts = []
+        monkeypatch.setattr(page_hotkey, "show_confirm_dialog", lambda *args: prompts.append(args))
+
+        manager = dialog.config_manager
+        manager.set_inapp_shortcut("inapp_confirm", "ctrl+d")
+        manager.set_inapp_shortcut("inapp_pin", "ctrl+c")
+        dialog.refresh_settings()
+
+        assert prompts == []
+        assert dialog._inapp_edits["inapp_confirm"].text() == "ctrl+d"
+        assert dialog._inapp_edits["inapp_pin"].text() == "ctrl+c"
+
+
+class TestTranslationTargetLang:
+    """翻译目标语言与原始存储值比较"""
+
+    def test_explicit_system_language_is_saved(self, dialog, monkeypatch):
+        """未保存时 get_translation_target_lang 返回系统语言，显式选中它也要写入"""
+        monkeypatch.setattr(dialog_module.I18nManager, "get_system_language", classmethod(lambda cls: "en"))
+        manager = dialog.config_manager
+        assert manager.get_translation_target_lang() == "EN"
+        dialog._ensure_page(4)
+
+        combo = dialog.translation_target_combo
+        combo.setCurrentIndex(combo.findData("EN"))
+        dialog.accept()
+
+        assert manager.get_app_setting("translation_target_lang", "") == "EN"
+
+
+class TestNativeFileDialog:
+    """文件夹选择框的原生/内置切换"""
+
+    def test_toggle_controls_folder_picker(self, dialog, monkeypatch):
+        """开关保存到配置，并决定是否带 DontUseNativeDialog"""
+        calls = []
+        monkeypatch.setattr(
+            dialog_module.QFileDialog, "getExistingDirectory",
+            lambda parent, title, start, options: calls.append(options) or "",
+        )
+        dontuse = dialog_module.QFileDialog.Option.DontUseNativeDialog
+
+        dialog._pick_directory("title", "")
+        assert calls[-1] & dontuse
+
+        dialog._ensure_page(7)
+        assert not dialog.native_file_dialog_toggle.isChecked()
+        dialog.native_file_dialog_toggle.setChecked(True)
+        dialog.accept()
+
+        assert dialog.config_manager.get_app_setting("native_file_dialog") is True
+        dialog._pick_directory("title", "")
+        assert not calls[-1] & dontuse
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+TextSettingsPanel 单元测试
+
+- 字号调整经防抖合并，且不会改动防抖间隔
+- 同步字体到控件时只发出一次字体变化，出错后守卫标志能复位
+"""
+import pytest
+from PySide6.QtGui import QFont
+
+from ui.text_settings_panel import TextSettingsPanel
+
+
+@pytest.fixture
+def panel(qapp):
+    p = TextSettingsPanel()
+    yield p
+    p.deleteLater()
+
+
+class TestSizeDebounce:
+    """字号防抖"""
+
+    def test_value_change_keeps_interval(self, panel):
+        """valueChanged 的 int 参数不能被当作 start(msec) 的间隔"""
+        panel.size_spin.setValue(120)
+
+        assert panel._size_timer.isActive()
+        assert panel._size_timer.interval() == 40
+
+    def test_pending_size_applied_on_timeout(self, panel):
+        """防抖到期后才应用新字号，且只发出一次"""
+        emitted = []
+        panel.font_changed.connect(emitted.append)
+
+        panel.size_spin.setValue(30)
+        panel.size_spin.setValue(31)
+        assert emitted == []
+
+        panel._size_timer.timeout.emit()
+
+        assert [font.pointSize() for font in emitted] == [31]
+
+
+class TestApplyFontToControls:
+    """_apply_font_to_controls 的 _applying_state 守卫"""
+
+    def test_emits_once(self, panel):
+        """逐个设置控件不触发 _on_font_changed，最后只发出一次"""
+        emitted = []
+        panel.font_changed.connect(emitted.append)
+        font = QFont(panel.current_font)
+        font.setPointSize(42)
+        font.setBold(True)
+        font.setItalic(True)
+
+        panel._apply_font_to_controls(font)
+
+        assert len(emitted) == 1
+        assert emitted[0].pointSize() == 42
+        assert emitted[0].bold() and emitted[0].italic()
+        assert not panel._size_timer.isActive()
+
+    def test_guard_reset_after_error(self, panel, monkeypatch):
+        """控件设置中途抛错时守卫标志仍被复位，面板继续响应修改"""
+        def boom(_checked):
+            raise RuntimeError("boom")
+        monkeypatch.setattr(panel.bold_btn, "setChecked", boom)
+
+        with pytest.raises(RuntimeError):
+            panel._apply_font_to_controls(QFont(panel.current_font))
+        monkeypatch.undo()
+
+        assert panel._applying_state is False
+        emitted = []
+        panel.font_changed.connect(emitted.append)
+        panel.italic_btn.setChecked(not panel.italic_btn.isChecked())
+        assert len(emitted) == 1
@@ -145,6 +145,22 @@ class TestToolSettingsManager:
         # 恢复
         manager.set_app_setting("log_level", "INFO")
 
+    def test_get_app_settings_batch(self, manager):
+        """批量读取应与逐项读取结果一致"""
+        manager.set_app_setting("log_level", "DEBUG")
+        manager.set_app_setting("preload_ocr", False)
+        values = manager.get_app_settings({
+            "log_level": None, "preload_ocr": True,
+            "preload_fonts": True, "pin_auto_toolbar": None,
+        })
+        assert values["log_level"] == "DEBUG"
+        assert values["preload_ocr"] is False
+        assert values["preload_fonts"] is True
+        assert values["pin_auto_toolbar"] == manager.get_pin_auto_toolbar()
+        # 分组必须已关闭，后续单项读取不受影响
+        assert manager.get_app_setting("log_level") == "DEBUG"
+        manager.set_app_setting("log_level", "INFO")
+
     def test_get_color(self, manager):
         """获取 QColor 对象"""
         from PySide6.QtGui import QColor
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+TranslationManager 线程生命周期测试
+
+- 被放弃的翻译线程仍被登记，直到真正结束
+- cleanup 先等待工作线程结束再释放单例
+- 等待超时时保留单例，不在线程运行中销毁父对象
+- 连接池只在工作线程全部结束后关闭
+"""
+import time
+
+import pytest
+from PySide6.QtCore import QThread, Signal
+
+from translation import DeepLService, TranslationManager
+
+
+class SlowThread(QThread):
+    """模拟网络请求：run 中睡眠一段时间"""
+    finished_signal = Signal(bool, str, str, str)
+
+    def __init__(self, delay, parent=None):
+        super().__init__(parent)
+        self._delay = delay
+
+    def run(self):
+        time.sleep(self._delay)
+
+
+@pytest.fixture
+def manager(qapp):
+    TranslationManager._instance = None
+    mgr = TranslationManager.instance()
+    yield mgr
+    for thread in list(mgr._workers):
+        thread.wait()
+    qapp.processEvents()
+    TranslationManager.cleanup()
+    TranslationManager._instance = None
+
+
+def start_worker(manager, delay):
+    thread = SlowThread(delay, parent=manager)
+    manager._track_worker(thread)
+    thread.start()
+    return thread
+
+
+class TestWorkerTracking:
+    """工作线程登记"""
+
+    def test_abandoned_thread_stays_tracked(self, manager, qapp):
+        """放弃的线程只断开结果信号，跑完后才移出集合"""
+        thread = start_worker(manager, 0.1)
+        manager._thread = thread
+
+        manager._stop_current_thread()
+        assert manager._thread is None
+        assert thread in manager._workers
+
+        thread.wait()
+        qapp.processEvents()
+        assert manager._workers == set()
+
+
+class TestCleanup:
+    """退出清理"""
+
+    def test_cleanup_waits_for_running_workers(self, manager):
+        """cleanup 等线程结束后才释放单例"""
+        thread = start_worker(manager, 0.2)
+
+        TranslationManager.cleanup()
+
+        assert thread.isFinished()
+        assert not TranslationManager.has_instance()
+
+    def test_connection_pool_closed_after_workers(self, manager, monkeypatch):
+        """连接池在线程结束后才关闭，超时时不关闭"""
+        closed = []
+        monkeypatch.setattr(DeepLService, "close", classmethod(lambda cls: closed.append(cls)))
+        thread = start_worker(manager, 0.3)
+
+        TranslationManager.cleanup(timeout_ms=10)
+        assert closed == []
+
+        TranslationManager.cleanup()
+        assert thread.isFinished()
+        assert closed == [DeepLService]
+
+    def test_cleanup_keeps_manager_when_wait_times_out(self, manager, qapp):
+        """超时仍在运行时保留单例，稍后可再次清理"""
+        thread = start_worker(manager, 0.5)
+
+        TranslationManager.cleanup(timeout_ms=10)
+        assert thread.isRunning()
+        assert TranslationManager._instance is manager
+
+        thread.wait()
+        qapp.processEvents()
+        TranslationManager.cleanup(timeout_ms=10)
+        assert not TranslationManager.has_instance()
@@ -14,10 +14,15 @@ deepl_service.py - DeepL 翻译 API 服务
     thread.start()
 """
 
+import base64
+import http.client
 import json
+import threading
+import time
+import urllib.parse
 import urllib.request
-import urllib.error
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from PySide6.QtCore import QThread, Signal
 
 from core import log_info, log_debug, log_error, log_warning
@@ -29,6 +34,18 @@ class DeepLService:
     # DeepL API 端点
     API_URL_FREE = "https://api-free.deepl.com/v2/translate"
     API_URL_PRO = "https://api.deepl.com/v2/translate"
+
+    # 空闲的 HTTPS 长连接，按 (目标主机, 代理) 分组；连续翻译复用同一 TCP/TLS 连接，
+    # 取出后由当前线程独占，用完放回
+    _idle_connections: Dict[Tuple[str, str], List[http.client.HTTPSConnection]] = {}
+    _pool_lock = threading.Lock()
+    _MAX_IDLE_PER_HOST = 4
+
+    # 最近的成功译文（LRU + 过期时间）：同一段文字重复翻译时直接返回，不再请求网络
+    _result_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    _CACHE_MAX = 128
+    _CACHE_TTL = 600.0  # 秒
     
     def __init__(self, api_key: str, use_pro: bool = False):
         """
@@ -83,82 +100,87 @@ class DeepLService:
                 "error": "API key not configured"
             }
         
+        # 键中带上密钥与接口地址：切换账号或 Free/Pro 后不能返回旧凭据下的译文
+        cache_key = (
+            self.api_key, self.api_url,
+            text, target_lang.upper(), (source_lang or "").upper(),
+            split_sentences, bool(preserve_formatting),
+        )
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            log_debug(f"命中翻译缓存: {len(text)} 字符 -> {target_lang}", "DeepL")
+            return cached
+
         try:
             # 构建请求数据
             # split_sentences: "0"=不分句, "1"=自动分句(保留换行), "nonewlines"=忽略换行按标点分句
             data = {
-                "text": text,
+                "text": [text],
                 "target_lang": target_lang.upper(),
                 "split_sentences": split_sentences,
-                "preserve_formatting": "1" if preserve_formatting else "0"
+                "preserve_formatting": bool(preserve_formatting)
             }
             
             if source_lang:
                 data["source_lang"] = source_lang.upper()
             
-            # 编码数据
-            post_data = urllib.parse.urlencode(data).encode('utf-8')
-            
-            # 创建请求
-            request = urllib.request.Request(
-                self.api_url,
-                data=post_data,
-                method='POST'
-            )
-            request.add_header('Content-Type', 'application/x-www-form-urlencoded')
-            request.add_header('Authorization', f'DeepL-Auth-Key {self.api_key}')
+            # 编码数据：JSON 请求体直接携带 UTF-8 原文，
+            # 比表单编码（中日文每字节都要转成 %XX）体积小得多
+            post_data = json.dumps(data, ensure_ascii=False).encode('utf-8')
             
             log_debug(f"发送翻译请求: {len(text)} 字符 -> {target_lang}", "DeepL")
             
             # 发送请求
-            with urllib.request.urlopen(request, timeout=timeout) as response:
-                result = json.loads(response.read().decode('utf-8'))
+            status, reason, body = self._post(post_data, timeout)
+            if status >= 400:
+                error_msg = self._parse_http_error(status, reason)
+                log_error(f"HTTP 错误: {error_msg}", "DeepL")
+                return {
+                    "success": False,
+                    "translated_text": "",
+                    "error": error_msg
+                }
+
+            result = json.loads(body)
+            
+            if 'translations' in result and result['translations']:
+                translation = result['translations'][0]
+                translated_text = translation.get('text', '')
+                detected_lang = translation.get('detected_source_language', '')
                 
-                if 'translations' in result and result['translations']:
-                    translation = result['translations'][0]
-                    translated_text = translation.get('text', '')
-                    detected_lang = translation.get('detected_source_language', '')
-                    
-                    log_info(f"翻译成功: {detected_lang} -> {target_lang}", "DeepL")
-                    
-                    return {
-                        "success": True,
-                        "translated_text": translated_text,
-                        "detected_source_lang": detected_lang,
-                        "error": ""
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "translated_text": "",
-                        "error": "Invalid API response format"
-                    }
-                    
-        except urllib.error.HTTPError as e:
-            error_msg = self._parse_http_error(e)
-            log_error(f"HTTP 错误: {error_msg}", "DeepL")
-            return {
-                "success": False,
-                "translated_text": "",
-                "error": error_msg
-            }
+                log_info(f"翻译成功: {detected_lang} -> {target_lang}", "DeepL")
+                
+                result = {
+                    "success": True,
+                    "translated_text": translated_text,
+                    "detected_source_lang": detected_lang,
+                    "error": ""
+                }
+                self._store_cached_result(cache_key, result)
+                return result
+            else:
+                return {
+                    "success": False,
+                    "translated_text": "",
+                    "error": "Invalid API response format"
+                }
             
-        except urllib.error.URLError as e:
-            log_error(f"网络错误: {e.reason}", "DeepL")
+        except json.JSONDecodeError as e:
+            log_error(f"JSON 解析失败: {e}", "DeepL")
             return {
                 "success": False,
                 "translated_text": "",
-                "error": f"Network error: {e.reason}"
+                "error": "Failed to parse API response"
             }
-            
-        except json.JSONDecodeError as e:
-            log_error(f"JSON 解析失败: {e}", "DeepL")
+
+        except (OSError, http.client.HTTPException) as e:
+            log_error(f"网络错误: {e}", "DeepL")
             return {
                 "success": False,
                 "translated_text": "",
-                "error": "Failed to parse API response"
+                "error": f"Network error: {e}"
             }
-            
+
         except Exception as e:
             log_error(f"未知错误: {e}", "DeepL")
             return {
@@ -167,7 +189,121 @@ class DeepLService:
                 "error": f"Translation failed: {str(e)}"
             }
     
-    def _parse_http_error(self, error: urllib.error.HTTPError) -> str:
+    @classmethod
+    def _get_cached_result(cls, key: tuple) -> Optional[Dict[str, Any]]:
+        """读取未过期的缓存译文（返回副本）"""
+        with cls._cache_lock:
+            entry = cls._result_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at >= cls._CACHE_TTL:
+                del cls._result_cache[key]
+                return None
+            cls._result_cache.move_to_end(key)
+            return dict(result)
+
+    @classmethod
+    def _store_cached_result(cls, key: tuple, result: Dict[str, Any]):
+        """写入缓存，超出容量时淘汰最久未用的条目"""
+        with cls._cache_lock:
+            cls._result_cache[key] = (time.monotonic(), dict(result))
+            cls._result_cache.move_to_end(key)
+            while len(cls._result_cache) > cls._CACHE_MAX:
+                cls._result_cache.popitem(last=False)
+
+    @classmethod
+    def clear_cache(cls):
+        """清空译文缓存"""
+        with cls._cache_lock:
+            cls._result_cache.clear()
+
+    def _post(self, body: bytes, timeout: int) -> Tuple[int, str, bytes]:
+        """
+        通过连接池发送 POST 请求
+        
+        复用的空闲连接可能已被服务端关闭，此时换新连接重试一次。
+        
+        Returns:
+            (状态码, 状态说明, 响应体)
+        """
+        url = urllib.parse.urlsplit(self.api_url)
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"DeepL-Auth-Key {self.api_key}",
+        }
+        retried = False
+        while True:
+            key, conn = self._acquire_connection(url.hostname, timeout)
+            reused = conn.sock is not None
+            try:
+                conn.request("POST", url.path, body=body, headers=headers)
+                response = conn.getresponse()
+                payload = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused and not retried:
+                    retried = True
+                    log_debug("空闲连接已失效，重新建立连接", "DeepL")
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._release_connection(key, conn)
+            return response.status, response.reason, payload
+
+    @classmethod
+    def _acquire_connection(cls, host: str, timeout: int):
+        """取出一个空闲连接，没有则新建；与 urlopen 一样遵循系统代理设置"""
+        proxy = urllib.request.getproxies().get("https", "")
+        if proxy and urllib.request.proxy_bypass(host):
+            proxy = ""
+        key = (host, proxy)
+        with cls._pool_lock:
+            idle = cls._idle_connections.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            conn.sock.settimeout(timeout)
+            return key, conn
+
+        if not proxy:
+            return key, http.client.HTTPSConnection(host, timeout=timeout)
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        parts = urllib.parse.urlsplit(proxy)
+        conn = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=timeout)
+        tunnel_headers = {}
+        if parts.username:
+            credentials = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+            tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+        conn.set_tunnel(host, headers=tunnel_headers)
+        return key, conn
+
+    @classmethod
+    def _release_connection(cls, key: Tuple[str, str], conn: http.client.HTTPSConnection):
+        """把连接放回空闲池，池满则直接关闭"""
+        with cls._pool_lock:
+            idle = cls._idle_connections.setdefault(key, [])
+            if len(idle) < cls._MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    @classmethod
+    def close(cls):
+        """关闭所有空闲连接（程序退出时调用）"""
+        with cls._pool_lock:
+            connections = [conn for idle in cls._idle_connections.values() for conn in idle]
+            cls._idle_connections.clear()
+        for conn in connections:
+            conn.close()
+
+    def _parse_http_error(self, code: int, reason: str) -> str:
         """解析 HTTP 错误"""
         error_messages = {
             400: "Bad request parameters",
@@ -181,11 +317,7 @@ class DeepLService:
             503: "DeepL service temporarily unavailable"
         }
         
-        return error_messages.get(error.code, f"HTTP {error.code}: {error.reason}")
-
-
-# 需要导入 urllib.parse
-import urllib.parse
+        return error_messages.get(code, f"HTTP {code}: {reason}")
 
 
 class TranslationThread(QThread):
@@ -74,8 +74,8 @@ class TranslationDialog(QDialog):
         }
 
     def _get_target_languages(self):
-        langs = self._get_languages()
-        return {k: v for k, v in langs.items() if k != "auto"}
+        # 目标语言就是原生名称表本身，无需先拼出含 auto 的字典再过滤
+        return TRANSLATION_LANGUAGES
 
     def _setup_ui(self):
         main_layout = QVBoxLayout(self)
@@ -184,6 +184,8 @@ class TranslationDialog(QDialog):
 
         # 源语言选择器
         self.source_lang_combo = QComboBox()
+        # 语言列表各项同高，视图无需逐项测量尺寸
+        self.source_lang_combo.view().setUniformItemSizes(True)
         for code, name in self._get_languages().items():
             self.source_lang_combo.addItem(name, code)
         idx = self.source_lang_combo.findData(self.source_lang)
@@ -200,6 +202,7 @@ class TranslationDialog(QDialog):
 
         # 目标语言选择器
         self.target_lang_combo = QComboBox()
+        self.target_lang_combo.view().setUniformItemSizes(True)
         for code, name in self._get_target_languages().items():
             self.target_lang_combo.addItem(name, code)
         idx = self.target_lang_combo.findData(self.target_lang)
@@ -25,11 +25,63 @@ translation_manager.py - 翻译窗口单例管理器
     )
 """
 
+import time
 from typing import Optional
-from PySide6.QtCore import QObject, QPoint, Signal
+from PySide6.QtCore import QObject, QPoint, QThread, Signal
+from PySide6.QtGui import QImage
 from PySide6.QtWidgets import QApplication
 
-from core import log_info, log_debug, log_error
+from core import log_info, log_debug, log_error, log_warning
+from core.qt_utils import safe_disconnect
+from .deepl_service import DeepLService, TranslationThread
+from .translation_dialog import TranslationLoadingDialog
+
+
+class _OCRThread(QThread):
+    """OCR识别线程（内部类）。只持有 QImage（值类型），不持有任何 QWidget。"""
+    finished_signal = Signal(bool, str)  # (成功, 识别文本或错误信息)
+
+    def __init__(self, image: QImage, parent=None):
+        super().__init__(parent)
+        self._image = image
+        self._cancelled = False
+
+    def cancel(self):
+        """请求取消（OCR 是同步 FFI 调用，无法中断，结果会被 disconnect 丢弃）"""
+        self._cancelled = True
+
+    def run(self):
+        try:
+            # OCR 为可选依赖，仍在子线程中按需导入
+            from ocr import is_ocr_available, recognize_text, format_ocr_result_text
+
+            if self._cancelled:
+                return
+
+            if not is_ocr_available():
+                self.finished_signal.emit(False, "OCR功能不可用")
+                return
+
+            # 执行OCR识别，使用dict格式获取完整信息（含坐标）
+            result = recognize_text(self._image, return_format="dict")
+
+            if self._cancelled:
+                return
+
+            if result and isinstance(result, dict) and result.get('code') == 100:
+                # 使用公共函数处理：按阅读顺序，同行合并
+                text = format_ocr_result_text(result)
+                if text and text.strip():
+                    self.finished_signal.emit(True, text)
+                else:
+                    self.finished_signal.emit(False, "未识别到文字")
+            else:
+                self.finished_signal.emit(False, "未识别到文字")
+
+        except Exception as e:
+            self.finished_signal.emit(False, f"OCR识别失败: {str(e)}")
+        finally:
+            self._image = None  # 释放图像数据
 
 
 class TranslationManager(QObject):
@@ -49,6 +101,8 @@ class TranslationManager(QObject):
         self._initialized = True
         self._dialog = None  # TranslationLoadingDialog 实例
         self._thread = None  # TranslationThread 实例
+        self._ocr_thread = None  # 截图翻译的 OCR 线程
+        self._workers = set()  # 已启动且尚未结束的线程（含已放弃的），退出时统一等待
         self._api_key = ""
         self._use_pro = False
         self._split_sentences = "nonewlines"  # 分句模式: "0"=不分句, "1"=自动分句, "nonewlines"=忽略换行
@@ -165,8 +219,6 @@ class TranslationManager(QObject):
         target_lang: str
     ):
         """确保翻译窗口存在（创建或复用）"""
-        from .translation_dialog import TranslationLoadingDialog
-        
         if self._dialog is None or not self._is_dialog_valid():
             # 创建新窗口
             log_debug("创建新翻译窗口", "Translation")
@@ -220,33 +272,64 @@ class TranslationManager(QObject):
         source_lang: str,
         use_pro: bool
     ):
-        """启动翻译线程"""
-        from .deepl_service import TranslationThread
+        """启动翻译线程（先放弃仍在进行的上一次翻译）"""
+        self._stop_current_thread()
         
         log_info(f"调用 DeepL API: target={target_lang}, use_pro={use_pro}, split_sentences={self._split_sentences}, preserve_formatting={self._preserve_formatting}", "DeepL")
         
+        # 以管理器为父对象，线程对象不会在运行中被回收；结束后自行释放
         self._thread = TranslationThread(
             text=text,
             api_key=api_key,
             target_lang=target_lang,
             use_pro=use_pro,
             split_sentences=self._split_sentences,
-            preserve_formatting=self._preserve_formatting
+            preserve_formatting=self._preserve_formatting,
+            parent=self
         )
         self._thread.finished_signal.connect(self._on_translation_finished)
+        self._track_worker(self._thread)
         self._thread.start()
     
+    def _track_worker(self, thread: QThread):
+        """登记工作线程：跑完后移出集合并 deleteLater；被放弃的线程也留在集合中直到结束"""
+        self._workers.add(thread)
+        thread.finished.connect(self._on_worker_finished)
+        thread.finished.connect(thread.deleteLater)
+
+    def _on_worker_finished(self):
+        self._workers.discard(self.sender())
+
+    def _wait_workers(self, timeout_ms: int) -> bool:
+        """断开所有工作线程的结果信号并等待结束，超时仍有线程在运行时返回 False"""
+        threads = list(self._workers)
+        for thread in threads:
+            safe_disconnect(thread.finished_signal)
+            if isinstance(thread, _OCRThread):
+                thread.cancel()
+        deadline = time.monotonic() + timeout_ms / 1000
+        all_finished = True
+        for thread in threads:
+            remaining = max(0, int((deadline - time.monotonic()) * 1000))
+            if not thread.wait(remaining):
+                all_finished = False
+        return all_finished
+
     def _stop_current_thread(self):
-        """停止当前翻译线程"""
+        """放弃当前翻译线程
+
+        网络请求无法中断，也不在主线程等待：断开结果信号（结果被丢弃），
+        线程在后台跑完后通过 finished → deleteLater 自行释放。
+        """
         if self._thread is not None:
-            if self._thread.isRunning():
-                self._thread.quit()
-                self._thread.wait(1000)  # 等待最多 1 秒
-            self._thread.deleteLater()
+            safe_disconnect(self._thread.finished_signal)
             self._thread = None
     
     def _on_translation_finished(self, success: bool, translated_text: str, error: str, detected_lang: str):
         """翻译完成回调"""
+        # 已放弃的线程在断开连接前可能已投递结果，直接丢弃
+        if self.sender() is not self._thread:
+            return
         log_debug(f"翻译完成: success={success}, detected_lang={detected_lang}", "Translation")
         
         if self._is_dialog_valid():
@@ -260,10 +343,8 @@ class TranslationManager(QObject):
         
         self.translation_finished.emit(success, translated_text, error)
         
-        # 清理线程
-        if self._thread:
-            self._thread.deleteLater()
-            self._thread = None
+        # 线程在 run() 返回后由 finished → deleteLater 释放，这里只解除引用
+        self._thread = None
     
     def _on_translate_requested(self, text: str, source_lang: str, target_lang: str):
         """处理翻译请求（来自翻译窗口的翻译按钮）"""
@@ -279,24 +360,8 @@ class TranslationManager(QObject):
         
         log_debug(f"翻译请求: -> {target_lang}", "Translation")
         
-        # 停止当前线程
-        self._stop_current_thread()
-        
         # 启动翻译
-        from .deepl_service import TranslationThread
-        
-        log_info(f"调用 DeepL API: target={target_lang}, use_pro={self._use_pro}, split_sentences={self._split_sentences}, preserve_formatting={self._preserve_formatting}", "DeepL")
-        
-        self._thread = TranslationThread(
-            text=text,
-            api_key=self._api_key,
-            target_lang=target_lang,
-            use_pro=self._use_pro,
-            split_sentences=self._split_sentences,
-            preserve_formatting=self._preserve_formatting
-        )
-        self._thread.finished_signal.connect(self._on_translation_finished)
-        self._thread.start()
+        self._start_translation(text, self._api_key, target_lang, source_lang, self._use_pro)
     
     def _on_dialog_destroyed(self):
         """窗口被销毁时的清理"""
@@ -321,12 +386,23 @@ class TranslationManager(QObject):
         return self._is_dialog_valid() and self._dialog.isVisible()
     
     @classmethod
-    def cleanup(cls):
-        """清理单例（程序退出时调用）"""
-        if cls._instance is not None:
-            cls._instance.close_dialog()
+    def cleanup(cls, timeout_ms: int = 2000):
+        """清理单例（程序退出时调用）
+
+        工作线程以管理器为父对象，管理器在线程运行中被销毁会导致 Qt 直接中止进程，
+        因此先等待所有线程结束（最多 timeout_ms），超时则保留单例不释放。
+        连接池同理：仍在运行的翻译线程可能正占用连接，或在关闭后把连接放回池中，
+        只有线程全部结束后才关闭空闲连接。
+        """
+        manager = cls._instance
+        if manager is not None:
+            manager.close_dialog()
+            if not manager._wait_workers(timeout_ms):
+                log_warning("仍有翻译/OCR 线程未结束，暂不释放 TranslationManager 和连接池", "Translation")
+                return
             cls._instance = None
             log_debug("TranslationManager 已清理", "Translation")
+        DeepLService.close()
     
     def translate_from_image(
         self,
@@ -354,8 +430,6 @@ class TranslationManager(QObject):
             split_sentences: 分句模式
             preserve_formatting: 保留格式
         """
-        from PySide6.QtGui import QPixmap
-        
         # 使用传入的参数或已配置的参数
         api_key = api_key or self._api_key
         if use_pro is None:
@@ -373,9 +447,8 @@ class TranslationManager(QObject):
         self._split_sentences = split_sentences
         self._preserve_formatting = preserve_formatting
         
-        # 保存目标语言和pixmap供OCR完成后使用
+        # 保存目标语言供OCR完成后使用（图片已交给 OCR 线程，不再额外持有）
         self._pending_target_lang = target_lang
-        self._pending_pixmap = pixmap
         
         log_info("截图翻译模式：显示窗口并启动OCR", "Translation")
         
@@ -401,9 +474,6 @@ class TranslationManager(QObject):
         关键设计：在主线程完成 QPixmap → QImage.copy() 转换，
         子线程只接收不含 GUI 资源的纯数据（QImage 是值类型，线程安全）。
         """
-        from PySide6.QtCore import QThread, Signal
-        from PySide6.QtGui import QImage
-
         # ── 主线程完成 GUI 资源转换（QPixmap 不能跨线程访问）──
         if pixmap is None or pixmap.isNull():
             log_debug("传入 pixmap 为空，跳过OCR", "Translation")
@@ -413,72 +483,29 @@ class TranslationManager(QObject):
             log_debug("QImage 转换失败，跳过OCR", "Translation")
             return
 
-        class OCRThread(QThread):
-            """OCR识别线程。只持有 QImage（值类型），不持有任何 QWidget。"""
-            finished_signal = Signal(bool, str)  # (成功, 识别文本或错误信息)
-            
-            def __init__(self, image: QImage):
-                super().__init__()
-                self._image = image
-                self._cancelled = False
-
-            def cancel(self):
-                """请求取消（OCR 是同步 FFI 调用，无法中断，结果会被 disconnect 丢弃）"""
-                self._cancelled = True
-            
-            def run(self):
-                try:
-                    from ocr import is_ocr_available, recognize_text, format_ocr_result_text
-                    
-                    if self._cancelled:
-                        return
-
-                    if not is_ocr_available():
-                        self.finished_signal.emit(False, "OCR功能不可用")
-                        return
-                    
-                    # 执行OCR识别，使用dict格式获取完整信息（含坐标）
-                    result = recognize_text(self._image, return_format="dict")
-
-                    if self._cancelled:
-                        return
-
-                    if result and isinstance(result, dict) and result.get('code') == 100:
-                        # 使用公共函数处理：按阅读顺序，同行合并
-                        text = format_ocr_result_text(result)
-                        if text and text.strip():
-                            self.finished_signal.emit(True, text)
-                        else:
-                            self.finished_signal.emit(False, "未识别到文字")
-                    else:
-                        self.finished_signal.emit(False, "未识别到文字")
-                        
-                except Exception as e:
-                    self.finished_signal.emit(False, f"OCR识别失败: {str(e)}")
-                finally:
-                    self._image = None  # 释放图像数据
-        
         # 旧线程：断开信号（结果被丢弃）再等待自然结束，绝不使用 terminate()
-        if hasattr(self, '_ocr_thread') and self._ocr_thread and self._ocr_thread.isRunning():
+        if self._ocr_thread is not None:
             self._ocr_thread.cancel()
-            from core.qt_utils import safe_disconnect
             safe_disconnect(self._ocr_thread.finished_signal)
             # 不等待（旧线程在后台跑完即可），避免阻塞主线程
-            self._ocr_thread.finished.connect(self._ocr_thread.deleteLater)
         
-        # 创建并启动新线程
-        self._ocr_thread = OCRThread(image)
+        # 创建并启动新线程；以管理器为父对象，跑完后通过 finished → deleteLater 释放
+        self._ocr_thread = _OCRThread(image, parent=self)
         self._ocr_thread.finished_signal.connect(self._on_ocr_finished)
+        self._track_worker(self._ocr_thread)
         self._ocr_thread.start()
         
         log_debug("OCR线程已启动", "Translation")
     
     def _on_ocr_finished(self, success: bool, result: str):
         """OCR识别完成回调"""
+        # 已被新截图取代的线程在断开连接前可能已投递结果，直接丢弃
+        if self.sender() is not self._ocr_thread:
+            return
         log_debug(f"OCR完成: success={success}, result_len={len(result) if result else 0}", "Translation")
         
-        # 清理pixmap引用
-        self._pending_pixmap = None
+        # 线程随后由 finished → deleteLater 释放，这里只解除引用
+        self._ocr_thread = None
         
         if not self._is_dialog_valid():
             log_debug("翻译窗口已关闭，忽略OCR结果", "Translation")
@@ -30,6 +30,7 @@ class ColorPickerButton(QPushButton):
         super().__init__(parent)
         self._color = QColor(initial_color)
         self._show_alpha = show_alpha
+        self._color_dialog = None  # 首次点击时创建，之后复用
         self.setFixedSize(size, size)
         self._update_style()
         self.clicked.connect(self._pick_color)
@@ -43,11 +44,20 @@ class ColorPickerButton(QPushButton):
         self._color = QColor(color)
         self._update_style()
 
+    def _get_color_dialog(self) -> QColorDialog:
+        """获取颜色对话框（首次调用时创建，按钮销毁时一并释放）"""
+        if self._color_dialog is None:
+            dlg = QColorDialog(None)
+            dlg.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
+            if self._show_alpha:
+                dlg.setOption(QColorDialog.ColorDialogOption.ShowAlphaChannel)
+            self.destroyed.connect(dlg.deleteLater)
+            self._color_dialog = dlg
+        return self._color_dialog
+
     def _pick_color(self) -> None:
-        dlg = QColorDialog(self._color, None)
-        dlg.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
-        if self._show_alpha:
-            dlg.setOption(QColorDialog.ColorDialogOption.ShowAlphaChannel)
+        dlg = self._get_color_dialog()
+        dlg.setCurrentColor(self._color)
 
         # 定位到按钮下方附近，超出屏幕则自动调整
         btn_global = self.mapToGlobal(QPoint(0, self.height() + 4))
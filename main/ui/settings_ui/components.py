@@ -3,8 +3,8 @@
 设置窗口 — 共享 UI 组件库
 """
 from PySide6.QtWidgets import QWidget, QFrame, QVBoxLayout, QHBoxLayout, QLabel
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor, QPainter
+from PySide6.QtCore import Qt, Signal, QUrl
+from PySide6.QtGui import QColor, QPainter, QDesktopServices
 from core import safe_event
 
 from qfluentwidgets import (
@@ -44,17 +44,6 @@ def theme_popup_hover_background() -> str:
     return theme_color("#F3F4F6", "#36393F")
 
 
-def theme_text_style(font_size: int = 13, bold: bool = False, extra: str = "") -> str:
-    weight = " font-weight: 600;" if bold else ""
-    suffix = f" {extra.strip()}" if extra.strip() else ""
-    return f"font-size: {font_size}px; background: transparent;{weight}{suffix}"
-
-
-def theme_caption_style(font_size: int = 12, extra: str = "") -> str:
-    suffix = f" {extra.strip()}" if extra.strip() else ""
-    return f"font-size: {font_size}px; background: transparent;{suffix}"
-
-
 def theme_menu_style() -> str:
     return f"""
         QMenu {{
@@ -88,8 +77,25 @@ class SettingCardGroup(_SettingCardGroupBase):
         self.setMinimumHeight(h)
 
 # ── 设置页通用样式常量 ────────────────────────────────
-LBL_STYLE = "font-size: 13px; background-color: transparent;"
-TITLE_STYLE = "font-size: 14px; font-weight: bold; background-color: transparent;"
+LBL_STYLE = "font-size: 13px;"
+TITLE_STYLE = "font-size: 14px; font-weight: bold;"
+SCROLL_AREA_STYLE = "QScrollArea { border: none; background: transparent; }"
+TRANSPARENT_STYLE = "background: transparent;"
+# 与 TRANSPARENT_STYLE 等价的规则写法，便于和其他规则拼接在同一样式表中
+TRANSPARENT_RULE = "* { background: transparent; }"
+# 旧版 SettingCard / HLine 的样式，由 SettingsDialog 的对话框级样式表统一下发
+CARD_STYLE = """
+    QFrame#Card {
+        background-color: #FFFFFF;
+        border-radius: 8px;
+        border: 1px solid #E5E5E5;
+    }
+    QFrame#HLine {
+        background-color: #F0F0F0;
+        border: none;
+        max-height: 1px;
+    }
+"""
 
 
 def make_row(label, ctrl_widget: QWidget) -> QHBoxLayout:
@@ -113,6 +119,47 @@ def make_card_title(text: str) -> QLabel:
     return lbl
 
 
+def fill_combo(combo, options, current=None):
+    """批量填充 (userData, 文本) 选项并选中 current 对应项（找不到则选第一项）。
+
+    填充期间屏蔽信号，避免每次 addItem / 首项自动选中都触发 currentIndexChanged。
+    """
+    combo.blockSignals(True)
+    try:
+        index = 0
+        for i, (data, text) in enumerate(options):
+            combo.addItem(text, userData=data)
+            if data == current:
+                index = i
+        combo.setCurrentIndex(index)
+    finally:
+        combo.blockSignals(False)
+
+
+def open_path(path: str) -> bool:
+    """用系统默认程序打开文件/目录（Qt 原生分发，不经 shell、不阻塞事件循环）。"""
+    return QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+
+
+def add_card_control(card, widget):
+    """把控件右对齐放进 Fluent SettingCard 的行布局，并留出统一的右侧边距"""
+    card.hBoxLayout.addWidget(widget, 0, Qt.AlignmentFlag.AlignRight)
+    card.hBoxLayout.addSpacing(16)
+
+
+def mark_styled_input(*widgets):
+    """标记输入框使用设置页统一输入样式（规则随页面根控件样式表安装，按 styledInput 属性匹配）。
+
+    HotkeyEdit 是组合控件，标记作用于其内部输入框，并清掉内部输入框自带的
+    样式表 —— 控件自身样式表的优先级高于祖先样式表。
+    """
+    for widget in widgets:
+        target = getattr(widget, "edit", widget)
+        if target is not widget:
+            widget.setStyleSheet("")
+        target.setProperty("styledInput", True)
+
+
 def adjust_button_width(button, min_width: int = 0, horizontal_padding: int = 28):
     """按当前文字和图标内容调整按钮宽度。"""
     button.ensurePolished()
@@ -136,13 +183,6 @@ class SettingCard(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("Card")
-        self.setStyleSheet("""
-            #Card {
-                background-color: #FFFFFF;
-                border-radius: 8px;
-                border: 1px solid #E5E5E5;
-            }
-        """)
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(20, 20, 20, 20)
         self.layout.setSpacing(15)
@@ -152,9 +192,9 @@ class HLine(QFrame):
     """分割线"""
     def __init__(self):
         super().__init__()
+        self.setObjectName("HLine")
         self.setFrameShape(QFrame.Shape.HLine)
         self.setFrameShadow(QFrame.Shadow.Sunken)
-        self.setStyleSheet("background-color: #F0F0F0; border: none; max-height: 1px;")
 
 
 # ── Fluent 辅助 ──────────────────────────────────────
@@ -191,6 +231,9 @@ class WhiteCard(QFrame):
     的局部背景异常，同时不受原版固定高度限制。
     """
 
+    _BG = QColor(255, 255, 255, 170)
+    _BORDER = QColor(0, 0, 0, 19)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFrameShape(QFrame.Shape.NoFrame)
@@ -201,12 +244,56 @@ class WhiteCard(QFrame):
         painter = QPainter(self)
         painter.setRenderHints(QPainter.RenderHint.Antialiasing)
 
-        painter.setBrush(QColor(255, 255, 255, 170))
-        painter.setPen(QColor(0, 0, 0, 19))
+        painter.setBrush(self._BG)
+        painter.setPen(self._BORDER)
 
         painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 6, 6)
 
 
+class FormRow(WhiteCard):
+    """「标题 — 控件」行卡片：左侧标题（可选说明），右侧纵向排列一个或多个控件。
+
+    取代各页面手写的 QHBoxLayout + QVBoxLayout + addStretch 组合，
+    控件通过 .controls 访问。
+    """
+
+    _MARGINS = (20, 8, 20, 8)
+    _SPACING = 12
+    _CONTROL_SPACING = 5
+
+    def __init__(self, title: str, *controls: QWidget, desc: str = None, parent=None):
+        super().__init__(parent)
+        self.controls = controls
+
+        row = QHBoxLayout(self)
+        row.setContentsMargins(*self._MARGINS)
+        row.setSpacing(self._SPACING)
+
+        self.titleLabel = QLabel(title, self)
+        self.titleLabel.setProperty("role", "cardTitle")
+        if desc:
+            text_box = QVBoxLayout()
+            text_box.setSpacing(2)
+            text_box.addWidget(self.titleLabel)
+            desc_lbl = QLabel(desc, self)
+            desc_lbl.setProperty("role", "caption")
+            desc_lbl.setWordWrap(True)
+            text_box.addWidget(desc_lbl)
+            row.addLayout(text_box)
+        else:
+            row.addWidget(self.titleLabel)
+        row.addStretch()
+
+        if len(controls) == 1:
+            row.addWidget(controls[0])
+        else:
+            ctrl_box = QVBoxLayout()
+            ctrl_box.setSpacing(self._CONTROL_SPACING)
+            for ctrl in controls:
+                ctrl_box.addWidget(ctrl)
+            row.addLayout(ctrl_box)
+
+
 def make_switch_card(dialog, icon, title, content, checked, attr_name, parent=None):
     """创建 SwitchSettingCard 并将其绑定到 dialog 属性。
 
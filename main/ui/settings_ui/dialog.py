@@ -6,17 +6,15 @@
 各个页面分别位于 page_*.py 模块中。
 """
 import os
-import subprocess
-import sys
 
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton,
     QStackedWidget, QWidget, QDialogButtonBox,
-    QFrame, QFileDialog,
+    QFrame, QFileDialog, QMenu,
 )
-from PySide6.QtCore import Qt, Signal
-from ui.dialogs import show_info_dialog
-from PySide6.QtGui import QFont, QIcon, QColor
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QPoint, QSignalBlocker
+from ui.dialogs import show_info_dialog, show_custom_confirm_dialog
+from PySide6.QtGui import QFont, QIcon, QColor, QPixmap, QPainter, QPalette
 
 from qfluentwidgets import (
     NavigationInterface, NavigationItemPosition,
@@ -28,32 +26,131 @@ from qframelesswindow import FramelessDialog
 from qfluentwidgets.window.fluent_window import FluentTitleBar
 
 from core import log_info, safe_event
-from core.logger import log_exception
-from core.constants import CSS_FONT_FAMILY, DEFAULT_FONT_FAMILY
+from core.logger import log_exception, get_logger, LogLevel, cleanup_old_logs
+from core.resource_manager import ResourceManager
+from core.theme import get_theme
+from core.i18n import I18nManager
+from settings import get_tool_settings_manager
+from core.constants import DEFAULT_FONT_FAMILY
 
 # 页面创建函数
-from .page_hotkey import create_hotkey_page
+from .page_hotkey import create_hotkey_page, INAPP_KEYS
 from .page_capture import create_capture_page
 from .page_clipboard import create_clipboard_page
 from .page_translation import create_translation_page
 from .page_log import create_log_page, refresh_latest_log_label
 from .page_misc import create_misc_page
-from .page_appearance import create_appearance_page
-from .page_developer import create_developer_page
+from .page_appearance import create_appearance_page, _update_color_btn, _apply_theme_swatch
+from .page_developer import create_developer_page, _PRELOAD_ITEMS
 from .page_about import create_about_page
 from .components import (
-    adjust_button_width, theme_surface_color, theme_sidebar_color,
+    adjust_button_width, open_path, theme_surface_color, theme_sidebar_color,
     theme_border_color, theme_input_background, theme_popup_background,
-    theme_popup_hover_background, theme_text_style, theme_caption_style,
-    theme_menu_style, theme_color,
+    theme_popup_hover_background,
+    theme_menu_style, theme_color, CARD_STYLE,
 )
 
 
+# 导航项：(route_key, 图标, 标题原文, 堆栈索引, 位置)，标题在构建时经 tr() 翻译
+_NAV_ITEMS = (
+    ("shortcuts", FluentIcon.COMMAND_PROMPT, "Shortcuts", 0, NavigationItemPosition.TOP),
+    ("capture", FluentIcon.CAMERA, "Capture Settings", 1, NavigationItemPosition.TOP),
+    ("clipboard", FluentIcon.PASTE, "Clipboard", 2, NavigationItemPosition.TOP),
+    ("appearance", FluentIcon.BRUSH, "Appearance", 3, NavigationItemPosition.TOP),
+    ("translation", FluentIcon.LANGUAGE, "Translation", 4, NavigationItemPosition.TOP),
+    ("log", FluentIcon.HISTORY, "Log Settings", 5, NavigationItemPosition.TOP),
+    ("other", FluentIcon.APPLICATION, "Other", 6, NavigationItemPosition.TOP),
+    ("about", FluentIcon.INFO, "About", 8, NavigationItemPosition.BOTTOM),
+)
+
+# 日志等级下拉框文本 → LogLevel
+_LOG_LEVELS = {
+    "DEBUG": LogLevel.DEBUG, "INFO": LogLevel.INFO,
+    "WARNING": LogLevel.WARNING, "ERROR": LogLevel.ERROR,
+}
+
+# 堆栈索引 → 页面标题原文（开发者页 7 由 _open_developer_page 单独设置标题）
+_PAGE_TITLES = {
+    0: "Shortcut Settings",
+    1: "Capture Settings",
+    2: "Clipboard Settings",
+    3: "Appearance Settings",
+    4: "Translation Settings",
+    5: "Log Settings",
+    6: "Other Settings",
+    8: "Software Information",
+}
+
+
+# accept() 读取控件值用的取值函数
+def _text(w):
+    return w.text().strip()
+
+
+def _raw_text(w):
+    return w.text()
+
+
+def _checked(w):
+    return w.isChecked()
+
+
+def _data(w):
+    return w.currentData()
+
+
+def _value(w):
+    return w.value()
+
+
+# accept() 逐项保存的普通字段：(dialog 属性名, 取值函数, config_manager 的 get_/set_ 后缀)
+_SAVE_FIELDS = (
+    ("hotkey_input", _text, "hotkey"),
+    ("hotkey_input_2", _text, "hotkey_2"),
+    ("smart_toggle", _checked, "smart_selection"),
+    ("save_toggle", _checked, "screenshot_save_enabled"),
+    ("save_path_lbl", _raw_text, "screenshot_save_path"),
+    ("screenshot_format_combo", _data, "screenshot_format"),
+    ("ocr_enable_toggle", _checked, "ocr_enabled"),
+    ("ocr_engine_combo", _data, "ocr_engine"),
+    ("ocr_grayscale_toggle", _checked, "ocr_grayscale_enabled"),
+    ("ocr_upscale_toggle", _checked, "ocr_upscale_enabled"),
+    ("ocr_scale_spinbox", _value, "ocr_upscale_factor"),
+    ("deepl_api_key_input", _text, "deepl_api_key"),
+    ("deepl_pro_toggle", _checked, "deepl_use_pro"),
+    ("split_sentences_toggle", _checked, "translation_split_sentences"),
+    ("preserve_formatting_toggle", _checked, "translation_preserve_formatting"),
+    ("show_main_window_toggle", _checked, "show_main_window"),
+    ("pin_auto_toolbar_toggle", _checked, "pin_auto_toolbar"),
+    ("clipboard_enabled_toggle", _checked, "clipboard_enabled"),
+    ("clipboard_history_limit_spin", _value, "clipboard_history_limit"),
+    ("clipboard_hotkey_edit", _text, "clipboard_hotkey"),
+    ("clipboard_hotkey_edit_2", _text, "clipboard_hotkey_2"),
+    ("cursor_move_combo", _data, "inapp_cursor_move_mode"),
+    ("engine_combo", _data, "long_stitch_engine"),
+    ("cooldown_spinbox", _value, "scroll_cooldown"),
+)
+
+# 走 get_app_setting/set_app_setting 的字段：(dialog 属性名, 取值函数, 配置键, 默认值)
+# 默认值为 None 时取 APP_DEFAULT_SETTINGS；预加载开关不在其中，默认开启
+_SAVE_APP_FIELDS = (
+    # 翻译目标语言与原始存储值比较："" 表示跟随系统，get_translation_target_lang 会把它换成系统语言，
+    # 用它比较会让显式选中与系统相同的语言永远不被保存
+    ("translation_target_combo", _data, "translation_target_lang", ""),
+    ("magnifier_color_format_combo", _data, "magnifier_color_copy_format", None),
+    ("info_hide_on_drag_toggle", _checked, "screenshot_info_hide_on_drag", None),
+    ("native_file_dialog_toggle", _checked, "native_file_dialog", None),
+) + tuple((attr, _checked, cfg_key, True) for attr, *_, cfg_key in _PRELOAD_ITEMS)
+
+
 class SettingsDialog(FramelessDialog):
     """现代化设置对话框 - Fluent 风格（无系统标题栏）"""
 
     wizard_requested = Signal()
 
+    _input_style = None  # _get_input_style() 的缓存
+    _taskbar_hicon = None  # _apply_taskbar_icon() 渲染出的 HICON 缓存
+
     def __init__(self, config_manager=None, current_hotkey="ctrl+shift+a", parent=None):
         super().__init__(parent)
         self.config_manager = config_manager
@@ -70,6 +167,8 @@ class SettingsDialog(FramelessDialog):
 
         self.setWindowTitle("jietuba")
         self.resize(860, 620)
+        # 字体只在对话框上设置一次，子控件（含下拉弹出列表）经字体继承获得，
+        # 样式表中不再重复 font-family
         self.setFont(QFont(DEFAULT_FONT_FAMILY, 10))
         self.setObjectName("SettingsDialog")
 
@@ -88,7 +187,6 @@ class SettingsDialog(FramelessDialog):
 
         # 设置窗口图标
         try:
-            from core.resource_manager import ResourceManager
             icon_path = ResourceManager.get_resource_path("svg/托盘.svg")
             if os.path.exists(icon_path):
                 self.setWindowIcon(QIcon(icon_path))
@@ -129,7 +227,6 @@ class SettingsDialog(FramelessDialog):
         logo_icon_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         try:
-            from core.resource_manager import ResourceManager
             icon_path = ResourceManager.get_resource_path("svg/托盘.svg")
             if os.path.exists(icon_path):
                 pm = QIcon(icon_path).pixmap(36, 36)
@@ -142,9 +239,9 @@ class SettingsDialog(FramelessDialog):
         text_box.setContentsMargins(0, 0, 0, 0)
         text_box.setSpacing(2)
         app_name_lbl = BodyLabel(self.tr("jietuba"))
-        app_name_lbl.setStyleSheet("font-size: 15px; font-weight: 600;")
+        app_name_lbl.setObjectName("SettingsAppName")
         app_desc_lbl = QLabel(self.tr("Settings"))
-        app_desc_lbl.setStyleSheet("font-size: 12px; color: rgba(120, 120, 120, 0.9); background: transparent;")
+        app_desc_lbl.setObjectName("SettingsAppDesc")
         text_box.addWidget(app_name_lbl)
         text_box.addWidget(app_desc_lbl)
         logo_layout.addLayout(text_box, 1)
@@ -166,19 +263,26 @@ class SettingsDialog(FramelessDialog):
         right_layout.setSpacing(14)
 
         self.content_title = QLabel(self.tr("Shortcut Settings"))
-        self.content_title.setStyleSheet("font-size: 22px; font-weight: 700; margin-bottom: 6px; background-color: transparent;")
+        self.content_title.setObjectName("SettingsContentTitle")
         self.content_title.hide()
 
+        # 页面按需构建：先放占位控件保持堆栈索引稳定，首次导航到该页时才调用工厂
+        self._page_factories = (
+            create_hotkey_page,           # 0
+            create_capture_page,          # 1
+            create_clipboard_page,        # 2
+            create_appearance_page,       # 3
+            create_translation_page,      # 4
+            create_log_page,              # 5
+            create_misc_page,             # 6
+            create_developer_page,        # 7
+            create_about_page,            # 8
+        )
+        self._pages = [None] * len(self._page_factories)
         self.content_stack = QStackedWidget()
-        self.content_stack.addWidget(create_hotkey_page(self))           # 0
-        self.content_stack.addWidget(create_capture_page(self))          # 1
-        self.content_stack.addWidget(create_clipboard_page(self))        # 2
-        self.content_stack.addWidget(create_appearance_page(self))       # 3
-        self.content_stack.addWidget(create_translation_page(self))      # 4
-        self.content_stack.addWidget(create_log_page(self))              # 5
-        self.content_stack.addWidget(create_misc_page(self))             # 6
-        self.content_stack.addWidget(create_developer_page(self))        # 7
-        self.content_stack.addWidget(create_about_page(self))            # 8
+        for _ in self._page_factories:
+            self.content_stack.addWidget(QWidget())
+        self._ensure_page(0)
 
         right_layout.addWidget(self.content_stack)
         right_layout.setStretchFactor(self.content_stack, 1)
@@ -199,18 +303,8 @@ class SettingsDialog(FramelessDialog):
         nav.setMinimumWidth(188)
         nav.setMaximumWidth(196)
 
-        self._nav_items = [
-            ("shortcuts", FluentIcon.COMMAND_PROMPT, self.tr("Shortcuts"), 0, NavigationItemPosition.TOP),
-            ("capture", FluentIcon.CAMERA, self.tr("Capture Settings"), 1, NavigationItemPosition.TOP),
-            ("clipboard", FluentIcon.PASTE, self.tr("Clipboard"), 2, NavigationItemPosition.TOP),
-            ("appearance", FluentIcon.BRUSH, self.tr("Appearance"), 3, NavigationItemPosition.TOP),
-            ("translation", FluentIcon.LANGUAGE, self.tr("Translation"), 4, NavigationItemPosition.TOP),
-            ("log", FluentIcon.HISTORY, self.tr("Log Settings"), 5, NavigationItemPosition.TOP),
-            ("other", FluentIcon.APPLICATION, self.tr("Other"), 6, NavigationItemPosition.TOP),
-            ("about", FluentIcon.INFO, self.tr("About"), 8, NavigationItemPosition.BOTTOM),
-        ]
-
-        for route_key, icon, text, stack_index, position in self._nav_items:
+        for route_key, icon, source_text, stack_index, position in _NAV_ITEMS:
+            text = self.tr(source_text)
             nav.addItem(
                 routeKey=route_key,
                 icon=icon,
@@ -222,6 +316,39 @@ class SettingsDialog(FramelessDialog):
 
         return nav
 
+    def _ensure_page(self, stack_index):
+        """确保指定页面已构建；首次访问时用真实页面替换占位控件"""
+        page = self._pages[stack_index]
+        if page is not None:
+            return page
+
+        page = self._page_factories[stack_index](self)
+        placeholder = self.content_stack.widget(stack_index)
+        current = self.content_stack.currentWidget()
+        self.content_stack.insertWidget(stack_index, page)
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        # insert/remove 会挪动 currentIndex，恢复为原当前页（占位本身为当前页时换成新页）
+        self.content_stack.setCurrentWidget(page if current is placeholder else current)
+        self._pages[stack_index] = page
+
+        # 新页面的控件补进未保存变更检测的基准快照，否则会被误判为已修改
+        snapshot = getattr(self, '_settings_snapshot', None)
+        if snapshot is not None:
+            for key, value in self._snapshot_settings().items():
+                snapshot.setdefault(key, value)
+        return page
+
+    def _prebuild_next_page(self):
+        """空闲时只预构建导航中紧邻当前页的下一页；其余页面仍在首次导航时构建"""
+        if not self.isVisible():
+            return
+        for idx in range(self.content_stack.currentIndex() + 1, len(self._pages)):
+            if idx in _PAGE_TITLES:
+                if self._pages[idx] is None:
+                    self._ensure_page(idx)
+                return
+
     def _set_current_nav(self, route_key: str):
         if hasattr(self, 'nav_list') and self.nav_list is not None:
             self.nav_list.setCurrentItem(route_key)
@@ -231,23 +358,27 @@ class SettingsDialog(FramelessDialog):
     # ================================================================
 
     def _create_toggle_row(self, title, desc, checked_state, toggle_obj):
-        """创建一个标准的一行设置：左字右开关"""
-        row = QHBoxLayout()
-        text_layout = QVBoxLayout()
+        """创建一个标准的一行设置：左字右开关（单个网格布局，标题/描述占左列，开关跨两行）"""
+        row = QGridLayout()
+        row.setColumnStretch(0, 1)
         lbl_title = QLabel(title)
-        lbl_title.setStyleSheet(theme_text_style(13))
-        text_layout.addWidget(lbl_title)
+        lbl_title.setProperty("role", "rowTitle")
+        row.addWidget(lbl_title, 0, 0)
+        row_span = 1
         if desc:
             lbl_desc = QLabel(desc)
-            lbl_desc.setStyleSheet(theme_caption_style(12))
-            text_layout.addWidget(lbl_desc)
-        row.addLayout(text_layout)
-        row.addStretch()
+            lbl_desc.setProperty("role", "caption")
+            row.addWidget(lbl_desc, 1, 0)
+            row_span = 2
         toggle_obj.setChecked(checked_state)
-        row.addWidget(toggle_obj)
+        row.addWidget(toggle_obj, 0, 1, row_span, 1, Qt.AlignmentFlag.AlignVCenter)
         return row
 
     def _get_input_style(self):
+        # 配色固定，样式表只生成一次；规则按 styledInput 属性匹配，
+        # 由含输入框的页面随根控件样式一次性安装，输入框只需 mark_styled_input() 打标记
+        if SettingsDialog._input_style is not None:
+            return SettingsDialog._input_style
         input_bg = theme_input_background()
         popup_bg = theme_popup_background()
         popup_hover = theme_popup_hover_background()
@@ -255,91 +386,83 @@ class SettingsDialog(FramelessDialog):
         border_color = theme_color("#D9DDE3", "#3A3D43")
         focus_bg = theme_color("#FFFFFF", "#25272B")
         arrow_color = theme_color("#666666", "#D0D0D0")
-        return f"""
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
+        SettingsDialog._input_style = f"""
+            QLineEdit[styledInput="true"], QSpinBox[styledInput="true"],
+            QDoubleSpinBox[styledInput="true"], QComboBox[styledInput="true"] {{
                 border: 1px solid {border_color}; border-radius: 4px;
                 padding: 4px 8px; background-color: {input_bg};
-                color: {text_color}; font-family: {CSS_FONT_FAMILY};
-                font-size: 12px;
+                color: {text_color}; font-size: 12px;
             }}
-            QLineEdit:focus, QSpinBox:focus {{
+            QLineEdit[styledInput="true"]:focus, QSpinBox[styledInput="true"]:focus {{
                 border: 1px solid #07C160; background-color: {focus_bg};
             }}
-            QSpinBox, QDoubleSpinBox {{ padding-right: 24px; }}
-            QSpinBox::up-button, QDoubleSpinBox::up-button {{
+            QSpinBox[styledInput="true"], QDoubleSpinBox[styledInput="true"] {{ padding-right: 24px; }}
+            QSpinBox[styledInput="true"]::up-button, QDoubleSpinBox[styledInput="true"]::up-button {{
                 subcontrol-origin: border; subcontrol-position: top right;
                 width: 20px; border-left: 1px solid {border_color};
                 border-bottom: 1px solid {border_color}; border-top-right-radius: 4px;
                 background: {input_bg};
             }}
-            QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover {{ background: {popup_hover}; }}
-            QSpinBox::up-button:pressed, QDoubleSpinBox::up-button:pressed {{ background: #C8E6C9; }}
-            QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {{
+            QSpinBox[styledInput="true"]::up-button:hover, QDoubleSpinBox[styledInput="true"]::up-button:hover {{ background: {popup_hover}; }}
+            QSpinBox[styledInput="true"]::up-button:pressed, QDoubleSpinBox[styledInput="true"]::up-button:pressed {{ background: #C8E6C9; }}
+            QSpinBox[styledInput="true"]::up-arrow, QDoubleSpinBox[styledInput="true"]::up-arrow {{
                 image: none; border-left: 4px solid transparent;
                 border-right: 4px solid transparent; border-bottom: 6px solid {arrow_color};
                 width: 0; height: 0;
             }}
-            QSpinBox::down-button, QDoubleSpinBox::down-button {{
+            QSpinBox[styledInput="true"]::down-button, QDoubleSpinBox[styledInput="true"]::down-button {{
                 subcontrol-origin: border; subcontrol-position: bottom right;
                 width: 20px; border-left: 1px solid {border_color};
                 border-bottom-right-radius: 4px; background: {input_bg};
             }}
-            QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {{ background: {popup_hover}; }}
-            QSpinBox::down-button:pressed, QDoubleSpinBox::down-button:pressed {{ background: #C8E6C9; }}
-            QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {{
+            QSpinBox[styledInput="true"]::down-button:hover, QDoubleSpinBox[styledInput="true"]::down-button:hover {{ background: {popup_hover}; }}
+            QSpinBox[styledInput="true"]::down-button:pressed, QDoubleSpinBox[styledInput="true"]::down-button:pressed {{ background: #C8E6C9; }}
+            QSpinBox[styledInput="true"]::down-arrow, QDoubleSpinBox[styledInput="true"]::down-arrow {{
                 image: none; border-left: 4px solid transparent;
                 border-right: 4px solid transparent; border-top: 6px solid {arrow_color};
                 width: 0; height: 0;
             }}
-            QComboBox::drop-down {{
+            QComboBox[styledInput="true"]::drop-down {{
                 subcontrol-origin: padding; subcontrol-position: top right;
                 width: 20px; border-left: 1px solid {border_color};
                 border-top-right-radius: 4px; border-bottom-right-radius: 4px;
                 background: {input_bg};
             }}
-            QComboBox::down-arrow {{
+            QComboBox[styledInput="true"]::down-arrow {{
                 image: none; border-left: 4px solid transparent;
                 border-right: 4px solid transparent; border-top: 6px solid {arrow_color};
                 width: 0; height: 0; margin-right: 6px;
             }}
-            QComboBox QAbstractItemView {{
+            QComboBox[styledInput="true"] QAbstractItemView {{
                 border: 1px solid {border_color}; background: {popup_bg};
                 selection-background-color: #07C160; selection-color: white;
-                font-family: {CSS_FONT_FAMILY};
                 font-size: 12px; color: {text_color}; outline: none;
             }}
-            QComboBox QAbstractItemView::item {{
+            QComboBox[styledInput="true"] QAbstractItemView::item {{
                 padding: 6px 8px; min-height: 24px; color: {text_color}; background: {popup_bg};
             }}
-            QComboBox QAbstractItemView::item:hover {{
+            QComboBox[styledInput="true"] QAbstractItemView::item:hover {{
                 background-color: {popup_hover}; color: {text_color};
             }}
-            QComboBox QAbstractItemView::item:selected {{
+            QComboBox[styledInput="true"] QAbstractItemView::item:selected {{
                 background-color: #07C160; color: white;
             }}
         """
+        return SettingsDialog._input_style
 
     # ================================================================
     # 导航 & 开发者入口
     # ================================================================
 
     def _on_nav_changed(self, stack_index, route_key=None):
-        title_map = {
-            0: self.tr("Shortcut Settings"),
-            1: self.tr("Capture Settings"),
-            2: self.tr("Clipboard Settings"),
-            3: self.tr("Appearance Settings"),
-            4: self.tr("Translation Settings"),
-            5: self.tr("Log Settings"),
-            6: self.tr("Other Settings"),
-            8: self.tr("Software Information"),
-        }
-
-        if stack_index in title_map:
-            self.content_title.setText(title_map[stack_index])
+        title = _PAGE_TITLES.get(stack_index)
+        if title is not None:
+            self.content_title.setText(self.tr(title))
+            self._ensure_page(stack_index)
             self.content_stack.setCurrentIndex(stack_index)
             if route_key:
                 self._set_current_nav(route_key)
+            QTimer.singleShot(0, self._prebuild_next_page)
 
         if stack_index == 2:
             self._refresh_clipboard_size()
@@ -348,14 +471,13 @@ class SettingsDialog(FramelessDialog):
         if not hasattr(self, '_clipboard_size_label') or not hasattr(self, '_calc_clipboard_storage_size'):
             return
         if delay_ms > 0:
-            from PySide6.QtCore import QTimer
             QTimer.singleShot(delay_ms, self._refresh_clipboard_size)
             return
         size_str = self._calc_clipboard_storage_size()
         self._clipboard_size_label.setText(size_str if size_str else "—")
 
+    @Slot(QPoint)
     def _show_logo_context_menu(self, pos):
-        from PySide6.QtWidgets import QMenu
         menu = QMenu(self)
         menu.setStyleSheet(theme_menu_style())
         action_dev = menu.addAction(self.tr("Developer Options"))
@@ -364,9 +486,11 @@ class SettingsDialog(FramelessDialog):
             self._open_developer_page()
 
     def _open_developer_page(self):
+        self._ensure_page(7)
         self.content_stack.setCurrentIndex(7)
         self.content_title.setText(self.tr("Developer Options"))
 
+    @Slot()
     def _open_welcome_wizard(self):
         self.wizard_requested.emit()
 
@@ -374,37 +498,37 @@ class SettingsDialog(FramelessDialog):
     # 文件/目录操作
     # ================================================================
 
+    def _pick_directory(self, title, start_dir):
+        """弹出文件夹选择框；默认用 Qt 内置对话框，避免原生对话框首开时的 Shell 初始化卡顿"""
+        options = QFileDialog.Option.ShowDirsOnly
+        if not self.config_manager.get_app_setting("native_file_dialog"):
+            options |= QFileDialog.Option.DontUseNativeDialog
+        return QFileDialog.getExistingDirectory(self, title, start_dir, options)
+
+    @Slot()
     def _change_save_dir(self):
-        new_dir = QFileDialog.getExistingDirectory(self, self.tr("Select Screenshot Save Folder"), self.config_manager.get_screenshot_save_path())
+        new_dir = self._pick_directory(self.tr("Select Screenshot Save Folder"), self.config_manager.get_screenshot_save_path())
         if new_dir:
             self.save_path_lbl.setText(new_dir)
 
+    def _open_in_file_manager(self, path):
+        """在文件管理器中打开目录（不存在时先创建）"""
+        os.makedirs(path, exist_ok=True)
+        open_path(path)
+
+    @Slot()
     def _open_save_dir(self):
-        path = self.config_manager.get_screenshot_save_path()
-        if not os.path.exists(path):
-            os.makedirs(path, exist_ok=True)
-        if sys.platform == "win32":
-            os.startfile(path)
-        elif sys.platform == "darwin":
-            subprocess.run(["open", path], check=False)
-        else:
-            subprocess.run(["xdg-open", path], check=False)
+        self._open_in_file_manager(self.config_manager.get_screenshot_save_path())
 
+    @Slot()
     def _change_log_dir(self):
-        new_dir = QFileDialog.getExistingDirectory(self, self.tr("Select Log Save Folder"), self.config_manager.get_log_dir())
+        new_dir = self._pick_directory(self.tr("Select Log Save Folder"), self.config_manager.get_log_dir())
         if new_dir:
             self.path_lbl.setText(new_dir)
 
+    @Slot()
     def _open_log_dir(self):
-        path = self.config_manager.get_log_dir()
-        if not os.path.exists(path):
-            os.makedirs(path, exist_ok=True)
-        if sys.platform == "win32":
-            os.startfile(path)
-        elif sys.platform == "darwin":
-            subprocess.run(["open", path], check=False)
-        else:
-            subprocess.run(["xdg-open", path], check=False)
+        self._open_in_file_manager(self.config_manager.get_log_dir())
 
     # ================================================================
     # 底部按钮
@@ -443,6 +567,7 @@ class SettingsDialog(FramelessDialog):
     # 重置页面
     # ================================================================
 
+    @Slot()
     def _reset_current_page(self):
         current_index = self.content_stack.currentIndex()
         if current_index == 0:
@@ -493,7 +618,6 @@ class SettingsDialog(FramelessDialog):
 
     def _reset_appearance_page(self):
         """重置外观设置页面"""
-        from .page_appearance import _update_color_btn
         defaults = self.config_manager.APP_DEFAULT_SETTINGS
         if hasattr(self, '_appearance_theme_color'):
             self._appearance_theme_color = QColor(defaults["theme_color"])
@@ -575,132 +699,93 @@ class SettingsDialog(FramelessDialog):
     # 保存（accept）
     # ================================================================
 
+    def _set_if_changed(self, name, value):
+        """仅当值与当前配置不同时才调用 config_manager.set_<name>"""
+        if getattr(self.config_manager, f"get_{name}")() != value:
+            getattr(self.config_manager, f"set_{name}")(value)
+
+    def _set_app_setting_if_changed(self, key, value, default=None):
+        """set_app_setting 的同款版本：值未变化时跳过写入"""
+        if self.config_manager.get_app_setting(key, default) != value:
+            self.config_manager.set_app_setting(key, value)
+
     def accept(self):
         """保存所有设置"""
         # 防止保存过程中（比如语言切换触发的窗口重建）触发未保存确认弹窗
         self._skip_unsaved_close_prompt = True
 
-        # 0. 快捷键
-        self.config_manager.set_hotkey(self.hotkey_input.text().strip())
-        if hasattr(self, 'hotkey_input_2'):
-            self.config_manager.set_hotkey_2(self.hotkey_input_2.text().strip())
-
-        # 1. 智能选区
-        if hasattr(self, 'smart_toggle'):
-            self.config_manager.set_smart_selection(self.smart_toggle.isChecked())
+        # 1. 普通字段：按表逐项比较后写入，未构建的页面自然跳过
+        for attr, read, name in _SAVE_FIELDS:
+            widget = getattr(self, attr, None)
+            if widget is not None:
+                self._set_if_changed(name, read(widget))
+        for attr, read, key, default in _SAVE_APP_FIELDS:
+            widget = getattr(self, attr, None)
+            if widget is not None:
+                self._set_app_setting_if_changed(key, read(widget), default)
 
         # 2. 日志设置
         if hasattr(self, 'log_toggle'):
             log_enabled = self.log_toggle.isChecked()
-            self.config_manager.set_log_enabled(log_enabled)
+            log_enabled_changed = log_enabled != self.config_manager.get_log_enabled()
+            if log_enabled_changed:
+                self.config_manager.set_log_enabled(log_enabled)
 
             if hasattr(self, 'log_level_combo'):
                 log_level = self.log_level_combo.currentText()
-                self.config_manager.set_log_level(log_level)
-                from core.logger import get_logger, LogLevel
-                logger = get_logger()
-                level_map = {
-                    "DEBUG": LogLevel.DEBUG, "INFO": LogLevel.INFO,
-                    "WARNING": LogLevel.WARNING, "ERROR": LogLevel.ERROR,
-                }
-                if log_level in level_map:
-                    logger.set_level(level_map[log_level])
-                    logger.set_console_level(level_map[log_level])
+                if log_level != self.config_manager.get_log_level():
+                    self.config_manager.set_log_level(log_level)
+                    level = _LOG_LEVELS.get(log_level)
+                    if level is not None:
+                        logger = get_logger()
+                        logger.set_level(level)
+                        logger.set_console_level(level)
 
             if hasattr(self, 'log_retention_spinbox'):
                 retention_days = self.log_retention_spinbox.value()
                 old_retention = self.config_manager.get_log_retention_days()
-                self.config_manager.set_log_retention_days(retention_days)
+                if retention_days != old_retention:
+                    self.config_manager.set_log_retention_days(retention_days)
                 if retention_days > 0 and retention_days < old_retention:
-                    from core.logger import cleanup_old_logs
                     log_dir = self.config_manager.get_log_dir()
                     cleanup_old_logs(log_dir, retention_days)
 
             if hasattr(self, 'path_lbl'):
                 old_log_dir = self.config_manager.get_log_dir()
                 new_log_dir = self.path_lbl.text()
-                self.config_manager.set_log_dir(new_log_dir)
-                from core.logger import get_logger
-                logger = get_logger()
-                logger.set_enabled(log_enabled)
-                if new_log_dir != old_log_dir:
-                    logger.set_log_dir(new_log_dir)
-                    show_info_dialog(
-                        self, self.tr("Log"),
-                        self.tr("Log save location changed.") + "\n" + self.tr("*Changes will fully take effect after restart.")
-                    )
+                if log_enabled_changed or new_log_dir != old_log_dir:
+                    logger = get_logger()
+                    if log_enabled_changed:
+                        # 开关未变时不重复调用，避免重建日志 handler
+                        logger.set_enabled(log_enabled)
+                    if new_log_dir != old_log_dir:
+                        self.config_manager.set_log_dir(new_log_dir)
+                        logger.set_log_dir(new_log_dir)
+                        show_info_dialog(
+                            self, self.tr("Log"),
+                            self.tr("Log save location changed.") + "\n" + self.tr("*Changes will fully take effect after restart.")
+                        )
                 self._refresh_latest_log_label()
 
-        # 3. 截图保存
-        if hasattr(self, 'save_toggle'):
-            self.config_manager.set_screenshot_save_enabled(self.save_toggle.isChecked())
-        if hasattr(self, 'save_path_lbl'):
-            self.config_manager.set_screenshot_save_path(self.save_path_lbl.text())
-        if hasattr(self, 'screenshot_format_combo'):
-            self.config_manager.set_screenshot_format(self.screenshot_format_combo.currentData())
-
-        # 4. OCR
-        if hasattr(self, 'ocr_enable_toggle'):
-            self.config_manager.set_ocr_enabled(self.ocr_enable_toggle.isChecked())
-        if hasattr(self, 'ocr_engine_combo'):
-            self.config_manager.set_ocr_engine(self.ocr_engine_combo.currentData())
-        if hasattr(self, 'ocr_grayscale_toggle'):
-            self.config_manager.set_ocr_grayscale_enabled(self.ocr_grayscale_toggle.isChecked())
-        if hasattr(self, 'ocr_upscale_toggle'):
-            self.config_manager.set_ocr_upscale_enabled(self.ocr_upscale_toggle.isChecked())
-        if hasattr(self, 'ocr_scale_spinbox'):
-            self.config_manager.set_ocr_upscale_factor(self.ocr_scale_spinbox.value())
-
-        # 5. 翻译
-        if hasattr(self, 'deepl_api_key_input'):
-            self.config_manager.set_deepl_api_key(self.deepl_api_key_input.text().strip())
-        if hasattr(self, 'deepl_pro_toggle'):
-            self.config_manager.set_deepl_use_pro(self.deepl_pro_toggle.isChecked())
-        if hasattr(self, 'translation_target_combo'):
-            self.config_manager.set_translation_target_lang(self.translation_target_combo.currentData())
-        if hasattr(self, 'split_sentences_toggle'):
-            self.config_manager.set_translation_split_sentences(self.split_sentences_toggle.isChecked())
-        if hasattr(self, 'preserve_formatting_toggle'):
-            self.config_manager.set_translation_preserve_formatting(self.preserve_formatting_toggle.isChecked())
-
-        # 6. 杂项
+        # 3. 开机自启（写注册表，不经 config_manager）
         if hasattr(self, 'autostart_toggle'):
             from ..welcome.page6_finish import FinishPage as _FP
             _FP._set_autostart(self.autostart_toggle.isChecked())
-        if hasattr(self, 'show_main_window_toggle'):
-            self.config_manager.set_show_main_window(self.show_main_window_toggle.isChecked())
-        if hasattr(self, 'pin_auto_toolbar_toggle'):
-            self.config_manager.set_pin_auto_toolbar(self.pin_auto_toolbar_toggle.isChecked())
-        if hasattr(self, 'magnifier_color_format_combo'):
-            self.config_manager.set_app_setting(
-                "magnifier_color_copy_format",
-                self.magnifier_color_format_combo.currentData()
-            )
 
-        # 界面语言
+        # 4. 界面语言
         if hasattr(self, 'language_combo'):
             new_lang = self.language_combo.currentData()
-            old_lang = self.config_manager.get_app_setting("language", "ja")
-            self.config_manager.qsettings.setValue("app/language", new_lang)
-            if new_lang != old_lang:
-                from core.i18n import I18nManager
+            if new_lang != self._initial_lang:
+                self.config_manager.qsettings.setValue("app/language", new_lang)
                 I18nManager.load_language(new_lang)
+                self._initial_lang = new_lang
 
-        # 7. 剪贴板
-        if hasattr(self, 'clipboard_enabled_toggle'):
-            self.config_manager.set_clipboard_enabled(self.clipboard_enabled_toggle.isChecked())
-        if hasattr(self, 'clipboard_history_limit_spin'):
-            self.config_manager.set_clipboard_history_limit(self.clipboard_history_limit_spin.value())
-        if hasattr(self, 'clipboard_hotkey_edit'):
-            self.config_manager.set_clipboard_hotkey(self.clipboard_hotkey_edit.text().strip())
-        if hasattr(self, 'clipboard_hotkey_edit_2'):
-            self.config_manager.set_clipboard_hotkey_2(self.clipboard_hotkey_edit_2.text().strip())
-
-        # 7.5 应用内快捷键
+        # 5. 应用内快捷键
         if hasattr(self, '_inapp_edits'):
             for cfg_key, edit in self._inapp_edits.items():
                 val = edit.text().strip()
-                if val and not val.endswith("+"):
+                if (val and not val.endswith("+")
+                        and val != self.config_manager.get_inapp_shortcut(cfg_key)):
                     self.config_manager.set_inapp_shortcut(cfg_key, val)
             # 通知钉图快捷键 handler 重新加载绑定
             try:
@@ -711,43 +796,17 @@ class SettingsDialog(FramelessDialog):
                     pin_ctrl._normal_handler.reload_bindings()
             except Exception as e:
                 log_exception(e, "重载 Pin 快捷键绑定")
-        if hasattr(self, 'cursor_move_combo'):
-            self.config_manager.set_inapp_cursor_move_mode(
-                self.cursor_move_combo.currentData()
-            )
-
-        # 8. 长截图/开发者
-        if hasattr(self, 'engine_combo'):
-            self.config_manager.set_long_stitch_engine(self.engine_combo.currentData())
-        if hasattr(self, 'cooldown_spinbox'):
-            self.config_manager.settings.setValue('screenshot/scroll_cooldown', self.cooldown_spinbox.value())
-
-        # 9. 预加载开关（重启生效）
-        if hasattr(self, 'preload_fonts_toggle'):
-            self.config_manager.set_app_setting("preload_fonts", self.preload_fonts_toggle.isChecked())
-        if hasattr(self, 'preload_screenshot_toggle'):
-            self.config_manager.set_app_setting("preload_screenshot", self.preload_screenshot_toggle.isChecked())
-        if hasattr(self, 'preload_toolbar_toggle'):
-            self.config_manager.set_app_setting("preload_toolbar", self.preload_toolbar_toggle.isChecked())
-        if hasattr(self, 'preload_ocr_toggle'):
-            self.config_manager.set_app_setting("preload_ocr", self.preload_ocr_toggle.isChecked())
-        if hasattr(self, 'preload_settings_toggle'):
-            self.config_manager.set_app_setting("preload_settings", self.preload_settings_toggle.isChecked())
-        if hasattr(self, 'preload_clipboard_toggle'):
-            self.config_manager.set_app_setting("preload_clipboard", self.preload_clipboard_toggle.isChecked())
-
-        # 10. 截图信息面板行为
-        if hasattr(self, 'info_hide_on_drag_toggle'):
-            self.config_manager.set_app_setting("screenshot_info_hide_on_drag", self.info_hide_on_drag_toggle.isChecked())
 
-        # 11. 外观设置（主题色、遮罩色）
-        from core.theme import get_theme
+        # 6. 外观设置（主题色、遮罩色）
         theme = get_theme()
         if hasattr(self, '_appearance_theme_color'):
             theme.set_theme_color(self._appearance_theme_color)
         if hasattr(self, '_appearance_mask_color'):
             theme.set_mask_color(self._appearance_mask_color)
 
+        # 所有 set_* 只写入 QSettings 缓冲，最后统一落盘一次
+        self.config_manager.settings.sync()
+
         log_info("すべての設定を保存しました", "Settings")
         self._settings_snapshot = self._snapshot_settings()
         self._skip_unsaved_close_prompt = True
@@ -771,10 +830,13 @@ class SettingsDialog(FramelessDialog):
 
     def _apply_dialog_stylesheet(self):
         """根据当前主题生成并应用对话框样式表"""
+        # 纯色背景走调色板，由原生绘制直接填充，不经过样式表匹配
+        pal = self.palette()
+        pal.setColor(QPalette.ColorRole.Window, QColor(theme_surface_color()))
+        self.setPalette(pal)
+        self.setAutoFillBackground(True)
+
         self.setStyleSheet(f"""
-            #SettingsDialog {{
-                background-color: {theme_surface_color()};
-            }}
             QWidget#SettingsLeftPanel {{
                 background-color: {theme_sidebar_color()};
                 border-right: 1px solid {theme_border_color()};
@@ -785,7 +847,37 @@ class SettingsDialog(FramelessDialog):
             QStackedWidget {{
                 background: transparent;
             }}
-        """)
+            QLabel#SettingsAppName {{
+                font-size: 15px;
+                font-weight: 600;
+            }}
+            QLabel#SettingsAppDesc {{
+                font-size: 12px;
+                color: rgba(120, 120, 120, 0.9);
+            }}
+            QLabel#SettingsContentTitle {{
+                font-size: 22px;
+                font-weight: 700;
+                margin-bottom: 6px;
+            }}
+            QLabel[role="cardTitle"] {{
+                font-size: 14px;
+            }}
+            QLabel[role="rowTitle"] {{
+                font-size: 13px;
+            }}
+            QLabel[role="caption"] {{
+                font-size: 12px;
+            }}
+            QLabel#SettingsHint {{
+                padding: 5px;
+            }}
+            QLabel#SettingsInfoNote {{
+                padding: 5px;
+                font-size: 12px;
+                color: #999;
+            }}
+        """ + CARD_STYLE)
 
     @safe_event
     def resizeEvent(self, e):
@@ -801,6 +893,8 @@ class SettingsDialog(FramelessDialog):
         self._settings_snapshot = self._snapshot_settings()
         super().showEvent(event)
         self._apply_taskbar_icon()
+        # 首帧绘制后，空闲时预构建下一页
+        QTimer.singleShot(0, self._prebuild_next_page)
 
     # ================================================================
     # 未保存变更检测
@@ -824,6 +918,7 @@ class SettingsDialog(FramelessDialog):
                       'clipboard_enabled_toggle', 'clipboard_auto_paste_toggle',
                       'autostart_toggle', 'show_main_window_toggle',
                       'pin_auto_toolbar_toggle', 'info_hide_on_drag_toggle',
+                      'native_file_dialog_toggle',
                       'preload_fonts_toggle', 'preload_screenshot_toggle',
                       'preload_toolbar_toggle', 'preload_ocr_toggle',
                       'preload_settings_toggle', 'preload_clipboard_toggle'):
@@ -864,8 +959,6 @@ class SettingsDialog(FramelessDialog):
 
     def _confirm_close_with_unsaved_changes(self) -> str:
         """显示未保存变更确认框，返回 save/discard/cancel"""
-        from ui.dialogs import show_custom_confirm_dialog
-        
         buttons_config = [
             {"id": "save", "text": self.tr("Save"), "role": QDialogButtonBox.ButtonRole.AcceptRole},
             {"id": "discard", "text": self.tr("Don't Save"), "role": QDialogButtonBox.ButtonRole.DestructiveRole},
@@ -901,25 +994,28 @@ class SettingsDialog(FramelessDialog):
     def _apply_taskbar_icon(self):
         try:
             import ctypes, tempfile
-            from PySide6.QtGui import QPixmap, QIcon, QPainter
-            from core.resource_manager import ResourceManager
-
-            _icon_path = ResourceManager.get_resource_path("svg/托盘.svg")
-            if not os.path.exists(_icon_path):
-                return
-
-            pix = QPixmap(32, 32)
-            pix.fill(Qt.GlobalColor.transparent)
-            p = QPainter(pix)
-            QIcon(_icon_path).paint(p, 0, 0, 32, 32)
-            p.end()
-
-            tmp_ico = os.path.join(tempfile.gettempdir(), "jietuba_win_icon.ico")
-            pix.save(tmp_ico, "ICO")
 
-            IMAGE_ICON = 1
-            LR_LOADFROMFILE = 0x10
-            hicon = ctypes.windll.user32.LoadImageW(None, tmp_ico, IMAGE_ICON, 32, 32, LR_LOADFROMFILE)
+            # SVG 渲染 + 写 ICO + LoadImageW 只做一次，之后每次显示直接复用 HICON
+            hicon = SettingsDialog._taskbar_hicon
+            if hicon is None:
+                _icon_path = ResourceManager.get_resource_path("svg/托盘.svg")
+                if not os.path.exists(_icon_path):
+                    return
+
+                pix = QPixmap(32, 32)
+                pix.fill(Qt.GlobalColor.transparent)
+                p = QPainter(pix)
+                QIcon(_icon_path).paint(p, 0, 0, 32, 32)
+                p.end()
+
+                tmp_ico = os.path.join(tempfile.gettempdir(), "jietuba_win_icon.ico")
+                pix.save(tmp_ico, "ICO")
+
+                IMAGE_ICON = 1
+                LR_LOADFROMFILE = 0x10
+                hicon = ctypes.windll.user32.LoadImageW(None, tmp_ico, IMAGE_ICON, 32, 32, LR_LOADFROMFILE)
+                if hicon:
+                    SettingsDialog._taskbar_hicon = hicon
             if hicon:
                 hwnd = int(self.winId())
                 WM_SETICON = 0x0080
@@ -941,11 +1037,12 @@ class SettingsDialog(FramelessDialog):
 
         # 应用内快捷键
         if hasattr(self, '_inapp_edits'):
-            from .page_hotkey import INAPP_KEYS
             defaults_map = {k: d for k, _, d in INAPP_KEYS}
             for cfg_key, edit in self._inapp_edits.items():
                 val = self.config_manager.get_inapp_shortcut(cfg_key)
-                edit.setText(val or defaults_map.get(cfg_key, ""))
+                # 回填期间屏蔽 textChanged：逐个写入时的中间态不能触发冲突检测弹窗
+                with QSignalBlocker(edit):
+                    edit.setText(val or defaults_map.get(cfg_key, ""))
         if hasattr(self, 'cursor_move_combo'):
             mode = self.config_manager.get_inapp_cursor_move_mode()
             idx = self.cursor_move_combo.findData(mode)
@@ -1021,32 +1118,40 @@ class SettingsDialog(FramelessDialog):
         if hasattr(self, 'pin_auto_toolbar_toggle'):
             self.pin_auto_toolbar_toggle.setChecked(self.config_manager.get_pin_auto_toolbar())
         if hasattr(self, 'language_combo'):
-            index = self.language_combo.findData(self.config_manager.get_app_setting("language", "ja"))
+            self._initial_lang = self.config_manager.get_app_setting("language", "ja")
+            index = self.language_combo.findData(self._initial_lang)
             if index >= 0:
                 self.language_combo.setCurrentIndex(index)
 
-        # 预加载开关重置（默认全部 True）
+        # 预加载开关重置（默认全部 True）+ 截图信息面板行为，一次批量读取
+        dev_values = self.config_manager.get_app_settings({
+            "preload_fonts": True, "preload_screenshot": True,
+            "preload_toolbar": True, "preload_ocr": True,
+            "preload_settings": True, "preload_clipboard": True,
+            "screenshot_info_hide_on_drag": False,
+            "native_file_dialog": False,
+        })
         if hasattr(self, 'preload_fonts_toggle'):
-            self.preload_fonts_toggle.setChecked(self.config_manager.get_app_setting("preload_fonts", True))
+            self.preload_fonts_toggle.setChecked(dev_values["preload_fonts"])
         if hasattr(self, 'preload_screenshot_toggle'):
-            self.preload_screenshot_toggle.setChecked(self.config_manager.get_app_setting("preload_screenshot", True))
+            self.preload_screenshot_toggle.setChecked(dev_values["preload_screenshot"])
         if hasattr(self, 'preload_toolbar_toggle'):
-            self.preload_toolbar_toggle.setChecked(self.config_manager.get_app_setting("preload_toolbar", True))
+            self.preload_toolbar_toggle.setChecked(dev_values["preload_toolbar"])
         if hasattr(self, 'preload_ocr_toggle'):
-            self.preload_ocr_toggle.setChecked(self.config_manager.get_app_setting("preload_ocr", True))
+            self.preload_ocr_toggle.setChecked(dev_values["preload_ocr"])
         if hasattr(self, 'preload_settings_toggle'):
-            self.preload_settings_toggle.setChecked(self.config_manager.get_app_setting("preload_settings", True))
+            self.preload_settings_toggle.setChecked(dev_values["preload_settings"])
         if hasattr(self, 'preload_clipboard_toggle'):
-            self.preload_clipboard_toggle.setChecked(self.config_manager.get_app_setting("preload_clipboard", True))
+            self.preload_clipboard_toggle.setChecked(dev_values["preload_clipboard"])
 
         # 截图信息面板行为
         if hasattr(self, 'info_hide_on_drag_toggle'):
-            self.info_hide_on_drag_toggle.setChecked(self.config_manager.get_app_setting("screenshot_info_hide_on_drag", False))
+            self.info_hide_on_drag_toggle.setChecked(dev_values["screenshot_info_hide_on_drag"])
+        if hasattr(self, 'native_file_dialog_toggle'):
+            self.native_file_dialog_toggle.setChecked(dev_values["native_file_dialog"])
 
         # 外观设置
         if hasattr(self, '_theme_color_btn'):
-            from core.theme import get_theme
-            from .page_appearance import _update_color_btn
             theme = get_theme()
             self._appearance_theme_color = QColor(theme.theme_color)
             mc = theme.mask_color
@@ -1056,20 +1161,6 @@ class SettingsDialog(FramelessDialog):
 
         # 剪切板主题色同步（在别处改了主题色后打开设置，确保显示最新值）
         if hasattr(self, '_clip_theme_btn'):
-            from settings import get_tool_settings_manager
-            from .page_appearance import _THEME_COLORS
             current_name = get_tool_settings_manager().get_clipboard_theme()
             self._clip_theme_name = current_name
-            for tname, accent, bg in _THEME_COLORS:
-                if tname == current_name:
-                    self._clip_theme_btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-                                stop:0 {bg}, stop:0.5 {bg},
-                                stop:0.5 {accent}, stop:1 {accent});
-                            border: 2px solid {accent};
-                            border-radius: 3px;
-                        }}
-                        QPushButton:hover {{ border: 2px solid #333; }}
-                    """)
-                    break 
+            _apply_theme_swatch(self._clip_theme_btn, current_name)
@@ -40,15 +40,28 @@ APP_DEFAULT_SETTINGS = {
     "clipboard_history_limit": 100,
     "clipboard_auto_cleanup": False,
     "magnifier_color_copy_format": "rgb_hex",
+    "native_file_dialog": False,
 }
 
+# 所有 MockConfig 实例共用一个 QSettings，首次使用时才创建
+_settings = None
+
+
+def _get_settings():
+    global _settings
+    if _settings is None:
+        _settings = QSettings("TestApp", "Settings")
+    return _settings
+
 
 class MockConfig:
     APP_DEFAULT_SETTINGS = APP_DEFAULT_SETTINGS
 
     def __init__(self):
-        self.settings = QSettings("TestApp", "Settings")
+        self.settings = _get_settings()
         self.qsettings = self.settings
+        # 通用 app 设置只保存在内存里，读写都不经过 QSettings
+        self._app_values = dict(APP_DEFAULT_SETTINGS)
 
     # --- getter / setter stubs ---
     def get_smart_selection(self): return False
@@ -65,6 +78,8 @@ class MockConfig:
     def set_long_stitch_engine(self, v): pass
     def get_long_stitch_debug(self): return False
     def set_long_stitch_debug(self, v): pass
+    def get_scroll_cooldown(self): return 0.15
+    def set_scroll_cooldown(self, v): pass
     def get_screenshot_save_enabled(self): return True
     def set_screenshot_save_enabled(self, v): pass
     def get_screenshot_save_path(self): return os.path.join(os.path.expanduser("~"), "Desktop", "スクショ")
@@ -91,8 +106,12 @@ class MockConfig:
     def set_deepl_api_key(self, v): pass
     def get_deepl_use_pro(self): return False
     def set_deepl_use_pro(self, v): pass
-    def get_app_setting(self, key, default=None): return default or ""
-    def set_app_setting(self, key, v): pass
+    def get_app_setting(self, key, default=None):
+        if default is None:
+            default = APP_DEFAULT_SETTINGS.get(key, "")
+        return self._app_values.get(key, default)
+    def set_app_setting(self, key, v): self._app_values[key] = v
+    def get_app_settings(self, keys): return {k: self.get_app_setting(k, d) for k, d in keys.items()}
     def get_translation_split_sentences(self): return True
     def set_translation_split_sentences(self, v): pass
     def get_translation_preserve_formatting(self): return True
@@ -1,25 +1,33 @@
 ﻿# -*- coding: utf-8 -*-
 """关于页面"""
-import webbrowser
-
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QScrollArea
-from PySide6.QtCore import Qt
 from qfluentwidgets import (
     SettingCard, FluentIcon,
     HyperlinkButton,
 )
-from .components import SettingCardGroup
+from .components import SettingCardGroup, add_card_control, SCROLL_AREA_STYLE, TRANSPARENT_STYLE
 from ui.dialogs import show_text_dialog
 
 
+_GITHUB_URL = "https://github.com/1003129155/jietuba"
+
+# 关于页信息卡片：(键, 图标, 标题源文本, 内容)
+_ABOUT_CARDS = (
+    ("name",    FluentIcon.APPLICATION, "Jietuba - Screenshot Tool", "Version: 2026.03.05"),
+    ("dev",     FluentIcon.PEOPLE,      "Developer",                 "RI JYAARU"),
+    ("license", FluentIcon.DOCUMENT,    "Licenses",                  "MIT"),
+    ("github",  FluentIcon.GITHUB,      "Source Code",               "github.com/1003129155/jietuba"),
+)
+
+
 def create_about_page(dialog) -> QScrollArea:
     """创建情報页面 - Fluent 风格"""
     scroll = QScrollArea()
     scroll.setWidgetResizable(True)
-    scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+    scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
     view = QWidget()
-    view.setStyleSheet("background: transparent;")
+    view.setStyleSheet(TRANSPARENT_STYLE)
     layout = QVBoxLayout(view)
     layout.setContentsMargins(0, 20, 10, 20)
     layout.setSpacing(16)
@@ -27,31 +35,13 @@ def create_about_page(dialog) -> QScrollArea:
     # ── 关于信息 ─────────────────────────────────────────────
     group = SettingCardGroup(dialog.tr("About"), view)
 
-    # 软件信息卡片
-    name_card = SettingCard(
-        FluentIcon.APPLICATION,
-        dialog.tr("Jietuba - Screenshot Tool"),
-        "Version: 2026.03.05",
-        parent=group,
-    )
-    group.addSettingCard(name_card)
-
-    # 开发者卡片
-    dev_card = SettingCard(
-        FluentIcon.PEOPLE,
-        dialog.tr("Developer"),
-        "RI JYAARU",
-        parent=group,
-    )
-    group.addSettingCard(dev_card)
+    cards = {}
+    for key, icon, title, content in _ABOUT_CARDS:
+        cards[key] = SettingCard(icon, dialog.tr(title), content, parent=group)
+        group.addSettingCard(cards[key])
 
-    license_card = SettingCard(
-        FluentIcon.DOCUMENT,
-        dialog.tr("Licenses"),
-        "MIT",
-        parent=group,
-    )
-    details_btn = HyperlinkButton(url="", text=dialog.tr("Details"), parent=license_card)
+    # 许可证：弹窗查看全文
+    details_btn = HyperlinkButton(url="", text=dialog.tr("Details"), parent=cards["license"])
     details_btn.clicked.connect(
         lambda: show_text_dialog(
             dialog,
@@ -59,25 +49,15 @@ def create_about_page(dialog) -> QScrollArea:
             dialog.tr("MIT License Text"),
         )
     )
-    license_card.hBoxLayout.addWidget(details_btn, 0, Qt.AlignmentFlag.AlignRight)
-    license_card.hBoxLayout.addSpacing(16)
-    group.addSettingCard(license_card)
+    add_card_control(cards["license"], details_btn)
 
-    # GitHub 链接卡片
-    github_card = SettingCard(
-        FluentIcon.GITHUB,
-        dialog.tr("Source Code"),
-        "github.com/1003129155/jietuba",
-        parent=group,
-    )
+    # GitHub 链接
     link_btn = HyperlinkButton(
-        url="https://github.com/1003129155/jietuba",
+        url=_GITHUB_URL,
         text=dialog.tr("Open GitHub"),
-        parent=github_card,
+        parent=cards["github"],
     )
-    github_card.hBoxLayout.addWidget(link_btn, 0, Qt.AlignmentFlag.AlignRight)
-    github_card.hBoxLayout.addSpacing(16)
-    group.addSettingCard(github_card)
+    add_card_control(cards["github"], link_btn)
 
     layout.addWidget(group)
     layout.addStretch(1)
@@ -6,6 +6,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor
+from core.theme import get_theme
+from settings import get_tool_settings_manager
 
 from qfluentwidgets import (
     SettingCard as FSettingCard, FluentIcon,
@@ -14,6 +16,7 @@ from qfluentwidgets import (
 from .components import (
     SettingCardGroup, theme_menu_style, theme_color,
     theme_popup_background, theme_border_color,
+    fill_combo, add_card_control, SCROLL_AREA_STYLE, TRANSPARENT_STYLE,
 )
 
 # 统一控件宽度
@@ -59,15 +62,51 @@ _THEME_COLORS = [
     ("orange", "#FF9800", "#F5C880"),
 ]
 
+# 主题色块样式缓存：{(主题名, 悬停边框色): 样式表}
+_theme_swatch_qss = {}
+
+
+def _theme_swatch_style(name: str):
+    """返回剪贴板主题色块按钮的样式表（同一主题、同一配色模式只拼接一次）。
+
+    未知主题名返回 None。
+    """
+    hover = theme_color('#333333', '#F3F3F3')
+    key = (name, hover)
+    qss = _theme_swatch_qss.get(key)
+    if qss is None:
+        for tname, accent, bg in _THEME_COLORS:
+            if tname == name:
+                qss = f"""
+                    QPushButton {{
+                        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+                            stop:0 {bg}, stop:0.5 {bg},
+                            stop:0.5 {accent}, stop:1 {accent});
+                        border: 2px solid {accent};
+                        border-radius: 3px;
+                    }}
+                    QPushButton:hover {{ border: 2px solid {hover}; }}
+                """
+                _theme_swatch_qss[key] = qss
+                break
+    return qss
+
+
+def _apply_theme_swatch(btn: QPushButton, name: str):
+    """将主题色块样式应用到按钮（样式未变化时不重复 setStyleSheet）"""
+    qss = _theme_swatch_style(name)
+    if qss is not None and btn.styleSheet() != qss:
+        btn.setStyleSheet(qss)
+
 
 def create_appearance_page(dialog) -> QWidget:
     """创建外观设置页面 — Fluent Design"""
     scroll = QScrollArea()
     scroll.setWidgetResizable(True)
-    scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+    scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
     view = QWidget()
-    view.setStyleSheet("background: transparent;")
+    view.setStyleSheet(TRANSPARENT_STYLE)
     layout = QVBoxLayout(view)
     layout.setContentsMargins(0, 0, 10, 0)
     layout.setSpacing(20)
@@ -87,7 +126,7 @@ def create_appearance_page(dialog) -> QWidget:
         dialog.tr("💡 Hint: Color changes take effect on the next screenshot."),
         view,
     )
-    hint.setStyleSheet("padding: 5px;")
+    hint.setObjectName("SettingsHint")
     layout.addWidget(hint)
 
     layout.addStretch()
@@ -101,7 +140,6 @@ def create_appearance_page(dialog) -> QWidget:
 
 def _build_screenshot_section(dialog, grp: SettingCardGroup):
     """截图外观：主题色 + 遮罩色"""
-    from core.theme import get_theme
     theme = get_theme()
 
     # 主题色
@@ -124,10 +162,7 @@ def _build_screenshot_section(dialog, grp: SettingCardGroup):
             _update_color_btn(dialog._theme_color_btn, color)
 
     dialog._theme_color_btn.clicked.connect(_pick_theme_color)
-    theme_card.hBoxLayout.addWidget(
-        dialog._theme_color_btn, 0, Qt.AlignmentFlag.AlignRight
-    )
-    theme_card.hBoxLayout.addSpacing(16)
+    add_card_control(theme_card, dialog._theme_color_btn)
     grp.addSettingCard(theme_card)
 
     # 遮罩色
@@ -151,10 +186,7 @@ def _build_screenshot_section(dialog, grp: SettingCardGroup):
             _update_color_btn(dialog._mask_color_btn, color)
 
     dialog._mask_color_btn.clicked.connect(_pick_mask_color)
-    mask_card.hBoxLayout.addWidget(
-        dialog._mask_color_btn, 0, Qt.AlignmentFlag.AlignRight
-    )
-    mask_card.hBoxLayout.addSpacing(16)
+    add_card_control(mask_card, dialog._mask_color_btn)
     grp.addSettingCard(mask_card)
 
 
@@ -165,7 +197,6 @@ def _build_screenshot_section(dialog, grp: SettingCardGroup):
 def _build_clipboard_section(dialog, grp: SettingCardGroup):
     """剪贴板外观：主题 + 字体大小 + 透明度"""
     from clipboard.themes import get_theme_manager
-    from settings import get_tool_settings_manager
     config = get_tool_settings_manager()
     theme_mgr = get_theme_manager()
 
@@ -182,22 +213,7 @@ def _build_clipboard_section(dialog, grp: SettingCardGroup):
     dialog._clip_theme_btn.setCursor(Qt.CursorShape.PointingHandCursor)
     dialog._clip_theme_name = current_theme_name
 
-    def _apply_theme_btn_style(name: str):
-        for tname, accent, bg in _THEME_COLORS:
-            if tname == name:
-                dialog._clip_theme_btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-                            stop:0 {bg}, stop:0.5 {bg},
-                            stop:0.5 {accent}, stop:1 {accent});
-                        border: 2px solid {accent};
-                        border-radius: 3px;
-                    }}
-                    QPushButton:hover {{ border: 2px solid {theme_color('#333333', '#F3F3F3')}; }}
-                """)
-                break
-
-    _apply_theme_btn_style(current_theme_name)
+    _apply_theme_swatch(dialog._clip_theme_btn, current_theme_name)
 
     def _show_theme_popup():
         from PySide6.QtWidgets import QMenu
@@ -228,7 +244,7 @@ def _build_clipboard_section(dialog, grp: SettingCardGroup):
 
         def _on_click(name: str):
             dialog._clip_theme_name = name
-            _apply_theme_btn_style(name)
+            _apply_theme_swatch(dialog._clip_theme_btn, name)
             theme_mgr.set_theme(name)
             _update_btns(name)
             menu.close()
@@ -250,10 +266,7 @@ def _build_clipboard_section(dialog, grp: SettingCardGroup):
         menu.popup(pos)
 
     dialog._clip_theme_btn.clicked.connect(_show_theme_popup)
-    theme_card.hBoxLayout.addWidget(
-        dialog._clip_theme_btn, 0, Qt.AlignmentFlag.AlignRight
-    )
-    theme_card.hBoxLayout.addSpacing(16)
+    add_card_control(theme_card, dialog._clip_theme_btn)
     grp.addSettingCard(theme_card)
 
     # ── 字体大小 ─────────────────────────────────────
@@ -265,13 +278,11 @@ def _build_clipboard_section(dialog, grp: SettingCardGroup):
     dialog._clip_font_combo = ComboBox(font_card)
     dialog._clip_font_combo.setFixedWidth(_CTRL_W)
 
-    font_options = config.get_clipboard_font_size_options()
-    current_font = config.get_clipboard_font_size()
-    for size in font_options:
-        dialog._clip_font_combo.addItem(f"{size}px", userData=size)
-    idx = dialog._clip_font_combo.findData(current_font)
-    if idx >= 0:
-        dialog._clip_font_combo.setCurrentIndex(idx)
+    fill_combo(
+        dialog._clip_font_combo,
+        [(size, f"{size}px") for size in config.get_clipboard_font_size_options()],
+        config.get_clipboard_font_size(),
+    )
 
     def _on_font_changed(index):
         size = dialog._clip_font_combo.itemData(index)
@@ -280,10 +291,7 @@ def _build_clipboard_section(dialog, grp: SettingCardGroup):
             theme_mgr.notify_font_size_changed(size)
 
     dialog._clip_font_combo.currentIndexChanged.connect(_on_font_changed)
-    font_card.hBoxLayout.addWidget(
-        dialog._clip_font_combo, 0, Qt.AlignmentFlag.AlignRight
-    )
-    font_card.hBoxLayout.addSpacing(16)
+    add_card_control(font_card, dialog._clip_font_combo)
     grp.addSettingCard(font_card)
 
     # ── 透明度 ───────────────────────────────────────
@@ -295,14 +303,14 @@ def _build_clipboard_section(dialog, grp: SettingCardGroup):
     dialog._clip_opacity_combo = ComboBox(opacity_card)
     dialog._clip_opacity_combo.setFixedWidth(_CTRL_W)
 
-    opacity_options = config.get_clipboard_window_opacity_options()
-    current_opacity = config.get_clipboard_window_opacity()
-    for percent in opacity_options:
-        label = dialog.tr("Opaque") if percent == 0 else f"{percent}%"
-        dialog._clip_opacity_combo.addItem(label, userData=percent)
-    idx = dialog._clip_opacity_combo.findData(current_opacity)
-    if idx >= 0:
-        dialog._clip_opacity_combo.setCurrentIndex(idx)
+    fill_combo(
+        dialog._clip_opacity_combo,
+        [
+            (percent, dialog.tr("Opaque") if percent == 0 else f"{percent}%")
+            for percent in config.get_clipboard_window_opacity_options()
+        ],
+        config.get_clipboard_window_opacity(),
+    )
 
     def _on_opacity_changed(index):
         percent = dialog._clip_opacity_combo.itemData(index)
@@ -311,9 +319,6 @@ def _build_clipboard_section(dialog, grp: SettingCardGroup):
             theme_mgr.notify_opacity_changed(percent)
 
     dialog._clip_opacity_combo.currentIndexChanged.connect(_on_opacity_changed)
-    opacity_card.hBoxLayout.addWidget(
-        dialog._clip_opacity_combo, 0, Qt.AlignmentFlag.AlignRight
-    )
-    opacity_card.hBoxLayout.addSpacing(16)
+    add_card_control(opacity_card, dialog._clip_opacity_combo)
     grp.addSettingCard(opacity_card)
  
\ No newline at end of file
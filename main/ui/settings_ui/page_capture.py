@@ -11,25 +11,41 @@ from qfluentwidgets import (
     FluentIcon, ComboBox, CaptionLabel,
     PushButton,
 )
-from .components import SettingCardGroup, WhiteCard, theme_text_style, theme_caption_style
+from .components import (
+    SettingCardGroup, WhiteCard, fill_combo, add_card_control, SCROLL_AREA_STYLE, TRANSPARENT_STYLE,
+)
+
 
+_ocr_module_found = None
 
-_CARD_TITLE_STYLE = theme_text_style(14)
-_CARD_CAPTION_STYLE = theme_caption_style(12)
+
+def _ocr_module_available() -> bool:
+    """OCR 模块是否已安装（find_spec 要扫描 sys.path，结果在进程内缓存）"""
+    global _ocr_module_found
+    if _ocr_module_found is None:
+        _ocr_module_found = importlib.util.find_spec("windows_media_ocr") is not None
+    return _ocr_module_found
 
 
 def create_capture_page(dialog) -> QWidget:
     """截图設定 ─ 智能选区 + 保存设置 + OCR"""
     scroll = QScrollArea()
     scroll.setWidgetResizable(True)
-    scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+    scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
     view = QWidget()
-    view.setStyleSheet("background: transparent;")
+    view.setStyleSheet(TRANSPARENT_STYLE)
     layout = QVBoxLayout(view)
     layout.setContentsMargins(0, 0, 10, 0)
     layout.setSpacing(20)
 
+    app_values = dialog.config_manager.get_app_settings({
+        "smart_selection": None,
+        "screenshot_save_enabled": None,
+        "screenshot_format": None,
+        "ocr_enabled": None,
+    })
+
     # ── 智能选区 ──────────────────────────────────────
     grp_smart = SettingCardGroup(dialog.tr("Smart Selection"), view)
 
@@ -39,7 +55,7 @@ def create_capture_page(dialog) -> QWidget:
         dialog.tr("Automatically recognizes UI elements at mouse cursor position."),
         parent=grp_smart,
     )
-    smart_card.setChecked(dialog.config_manager.get_smart_selection())
+    smart_card.setChecked(app_values["smart_selection"])
     dialog.smart_toggle = smart_card
     grp_smart.addSettingCard(smart_card)
 
@@ -54,7 +70,7 @@ def create_capture_page(dialog) -> QWidget:
         dialog.tr("Automatically saves as file when capturing."),
         parent=grp_save,
     )
-    save_card.setChecked(dialog.config_manager.get_screenshot_save_enabled())
+    save_card.setChecked(app_values["screenshot_save_enabled"])
     dialog.save_toggle = save_card
     grp_save.addSettingCard(save_card)
 
@@ -65,11 +81,11 @@ def create_capture_page(dialog) -> QWidget:
     path_h.setSpacing(12)
 
     path_icon_lbl = QLabel(dialog.tr("Save Folder:"), path_card)
-    path_icon_lbl.setStyleSheet(_CARD_TITLE_STYLE)
+    path_icon_lbl.setProperty("role", "cardTitle")
     dialog.save_path_lbl = QLabel(dialog.config_manager.get_screenshot_save_path(), path_card)
     dialog.save_path_lbl.setWordWrap(True)
     dialog.save_path_lbl.setCursor(Qt.CursorShape.PointingHandCursor)
-    dialog.save_path_lbl.setStyleSheet(_CARD_CAPTION_STYLE)
+    dialog.save_path_lbl.setProperty("role", "caption")
 
     btn_change = PushButton(dialog.tr("Change"), path_card)
     btn_change.setFixedHeight(32)
@@ -93,19 +109,13 @@ def create_capture_page(dialog) -> QWidget:
         parent=grp_save,
     )
     dialog.screenshot_format_combo = ComboBox(fmt_card)
-    dialog.screenshot_format_combo.addItem("PNG", userData="PNG")
-    dialog.screenshot_format_combo.addItem("JPG", userData="JPG")
-    dialog.screenshot_format_combo.addItem("BMP", userData="BMP")
-    dialog.screenshot_format_combo.addItem("WebP", userData="WEBP")
-    dialog.screenshot_format_combo.setFixedWidth(110)
-    _fmt_idx = {"PNG": 0, "JPG": 1, "BMP": 2, "WEBP": 3}.get(
-        dialog.config_manager.get_screenshot_format().upper(), 0
-    )
-    dialog.screenshot_format_combo.setCurrentIndex(_fmt_idx)
-    fmt_card.hBoxLayout.addWidget(
-        dialog.screenshot_format_combo, 0, Qt.AlignmentFlag.AlignRight
+    fill_combo(
+        dialog.screenshot_format_combo,
+        (("PNG", "PNG"), ("JPG", "JPG"), ("BMP", "BMP"), ("WEBP", "WebP")),
+        app_values["screenshot_format"].upper(),
     )
-    fmt_card.hBoxLayout.addSpacing(16)
+    dialog.screenshot_format_combo.setFixedWidth(110)
+    add_card_control(fmt_card, dialog.screenshot_format_combo)
     grp_save.addSettingCard(fmt_card)
 
     layout.addWidget(grp_save)
@@ -113,16 +123,14 @@ def create_capture_page(dialog) -> QWidget:
     # ── OCR ───────────────────────────────────────────
     grp_ocr = SettingCardGroup(dialog.tr("OCR"), view)
 
-    ocr_available = importlib.util.find_spec("windows_media_ocr") is not None
+    ocr_available = _ocr_module_available()
     ocr_card = SwitchSettingCard(
         FluentIcon.SEARCH,
         dialog.tr("Enable OCR"),
         dialog.tr("Enables text recognition and selection in pinned windows."),
         parent=grp_ocr,
     )
-    ocr_card.setChecked(
-        dialog.config_manager.get_ocr_enabled() if ocr_available else False
-    )
+    ocr_card.setChecked(app_values["ocr_enabled"] if ocr_available else False)
     if not ocr_available:
         ocr_card.setEnabled(False)
         ocr_card.setChecked(False)
@@ -144,7 +152,7 @@ def create_capture_page(dialog) -> QWidget:
         dialog.tr("💡 Hint: Even with auto-save off, it will be copied to clipboard."),
         view,
     )
-    hint.setStyleSheet("padding: 5px;")
+    hint.setObjectName("SettingsHint")
     layout.addWidget(hint)
 
     layout.addStretch()
@@ -1,11 +1,10 @@
 ﻿# -*- coding: utf-8 -*-
 """剪贴板设置页 — Fluent Design"""
 import os
-import sys
 
 from core.logger import log_exception
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea,
+    QWidget, QVBoxLayout, QGridLayout, QLabel, QScrollArea,
 )
 from PySide6.QtCore import Qt
 from ui.dialogs import show_info_dialog, show_warning_dialog, show_confirm_checkbox_dialog
@@ -14,21 +13,19 @@ from qfluentwidgets import (
     FluentIcon, SpinBox, CaptionLabel,
     PushButton, PrimaryPushButton,
 )
-from .components import SettingCardGroup, WhiteCard, theme_text_style, theme_caption_style
-
-
-_CARD_TITLE_STYLE = theme_text_style(14)
-_CARD_CAPTION_STYLE = theme_caption_style(12)
+from .components import (
+    SettingCardGroup, WhiteCard, open_path, add_card_control, SCROLL_AREA_STYLE, TRANSPARENT_STYLE,
+)
 
 
 def create_clipboard_page(dialog) -> QWidget:
     """创建剪贴板设置页面 — Fluent Design"""
     scroll = QScrollArea()
     scroll.setWidgetResizable(True)
-    scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+    scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
     view = QWidget()
-    view.setStyleSheet("background: transparent;")
+    view.setStyleSheet(TRANSPARENT_STYLE)
     layout = QVBoxLayout(view)
     layout.setContentsMargins(0, 0, 10, 0)
     layout.setSpacing(20)
@@ -63,10 +60,7 @@ def create_clipboard_page(dialog) -> QWidget:
         dialog.config_manager.get_clipboard_history_limit()
     )
     dialog.clipboard_history_limit_spin.setFixedWidth(150)
-    limit_card.hBoxLayout.addWidget(
-        dialog.clipboard_history_limit_spin, 0, Qt.AlignmentFlag.AlignRight
-    )
-    limit_card.hBoxLayout.addSpacing(16)
+    add_card_control(limit_card, dialog.clipboard_history_limit_spin)
     grp_history.addSettingCard(limit_card)
 
     layout.addWidget(grp_history)
@@ -96,39 +90,38 @@ def create_clipboard_page(dialog) -> QWidget:
     open_folder_btn.clicked.connect(
         lambda: _open_clipboard_data_folder(dialog, db_path)
     )
-    storage_card.hBoxLayout.addWidget(
-        open_folder_btn, 0, Qt.AlignmentFlag.AlignRight
-    )
-    storage_card.hBoxLayout.addSpacing(16)
+    add_card_control(storage_card, open_folder_btn)
     grp_data.addSettingCard(storage_card)
 
     # 清理
+    # 单个网格布局：标题/描述占左列两行，容量标签和按钮跨两行居右
     cleanup_card = WhiteCard(grp_data)
-    cleanup_h = QHBoxLayout(cleanup_card)
-    cleanup_h.setContentsMargins(20, 12, 20, 12)
-    cleanup_h.setSpacing(12)
+    cleanup_grid = QGridLayout(cleanup_card)
+    cleanup_grid.setContentsMargins(20, 12, 20, 12)
+    cleanup_grid.setHorizontalSpacing(12)
+    cleanup_grid.setVerticalSpacing(2)
+    cleanup_grid.setColumnStretch(0, 1)
 
-    cleanup_left = QVBoxLayout()
-    cleanup_left.setSpacing(2)
     cleanup_title = QLabel(dialog.tr("Clear Clipboard History"), cleanup_card)
-    cleanup_title.setStyleSheet(_CARD_TITLE_STYLE)
-    cleanup_left.addWidget(cleanup_title)
+    cleanup_title.setProperty("role", "cardTitle")
+    cleanup_grid.addWidget(cleanup_title, 0, 0)
 
     dialog._clipboard_size_label = QLabel("…", cleanup_card)
-    dialog._clipboard_size_label.setStyleSheet(_CARD_CAPTION_STYLE)
+    dialog._clipboard_size_label.setProperty("role", "caption")
     dialog._calc_clipboard_storage_size = _calc_clipboard_storage_size
     _refresh_clipboard_size_async(dialog)
 
     cleanup_desc = QLabel(dialog.tr("Delete all clipboard history records"), cleanup_card)
-    cleanup_desc.setStyleSheet(_CARD_CAPTION_STYLE)
-    cleanup_left.addWidget(cleanup_desc)
+    cleanup_desc.setProperty("role", "caption")
+    cleanup_grid.addWidget(cleanup_desc, 1, 0)
 
-    cleanup_h.addLayout(cleanup_left, 1)
-    cleanup_h.addWidget(dialog._clipboard_size_label)
+    cleanup_grid.addWidget(
+        dialog._clipboard_size_label, 0, 1, 2, 1, Qt.AlignmentFlag.AlignVCenter
+    )
 
     clear_btn = PrimaryPushButton(dialog.tr("Clear History"), cleanup_card)
     clear_btn.clicked.connect(lambda: _clear_clipboard_history(dialog))
-    cleanup_h.addWidget(clear_btn)
+    cleanup_grid.addWidget(clear_btn, 0, 2, 2, 1, Qt.AlignmentFlag.AlignVCenter)
     cleanup_card.setFixedHeight(60)
     grp_data.addSettingCard(cleanup_card)
 
@@ -138,7 +131,7 @@ def create_clipboard_page(dialog) -> QWidget:
     hint = CaptionLabel(
         dialog.tr("💡 Hint: Set clipboard hotkey in Shortcuts settings."), view
     )
-    hint.setStyleSheet("padding: 5px;")
+    hint.setObjectName("SettingsHint")
     layout.addWidget(hint)
 
     layout.addStretch()
@@ -232,16 +225,10 @@ def _calc_clipboard_storage_size() -> str:
 
 def _open_clipboard_data_folder(dialog, path: str):
     """打开剪贴板数据文件夹"""
-    import subprocess
     try:
         folder = os.path.dirname(path) if os.path.isfile(path) else path
         if os.path.exists(folder):
-            if sys.platform == 'win32':
-                subprocess.run(['explorer', folder])
-            elif sys.platform == 'darwin':
-                subprocess.run(['open', folder])
-            else:
-                subprocess.run(['xdg-open', folder])
+            open_path(folder)
         else:
             show_warning_dialog(dialog, dialog.tr("Warning"), dialog.tr("Folder does not exist"))
     except Exception as e:
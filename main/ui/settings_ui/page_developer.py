@@ -3,23 +3,51 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea,
 )
-from PySide6.QtCore import Qt
 from qfluentwidgets import (
     SwitchSettingCard, SettingCard as FSettingCard,
     FluentIcon, ComboBox, DoubleSpinBox,
     BodyLabel, CaptionLabel, PrimaryPushButton,
 )
-from .components import SettingCardGroup
+from .components import SettingCardGroup, fill_combo, add_card_control, SCROLL_AREA_STYLE, TRANSPARENT_STYLE
+
+
+# 启动预加载开关：(dialog 属性名, 图标, 标题原文, 描述原文, 配置键)
+_PRELOAD_ITEMS = (
+    ("preload_fonts_toggle", FluentIcon.FONT,
+     "Preload Fonts",
+     "Pre-scan system font list on startup",
+     "preload_fonts"),
+    ("preload_screenshot_toggle", FluentIcon.CAMERA,
+     "Preload Screenshot Modules",
+     "Pre-load mss, canvas, tools in background thread",
+     "preload_screenshot"),
+    ("preload_toolbar_toggle", FluentIcon.LAYOUT,
+     "Preload Toolbar",
+     "Pre-create toolbar widgets to avoid first-capture lag",
+     "preload_toolbar"),
+    ("preload_ocr_toggle", FluentIcon.SEARCH,
+     "Preload OCR Engine",
+     "Pre-load OCR model in background thread",
+     "preload_ocr"),
+    ("preload_settings_toggle", FluentIcon.SETTING,
+     "Preload Settings Window",
+     "Pre-create the settings dialog on startup",
+     "preload_settings"),
+    ("preload_clipboard_toggle", FluentIcon.PASTE,
+     "Preload Clipboard Manager",
+     "Initialize clipboard monitoring on startup",
+     "preload_clipboard"),
+)
 
 
 def create_developer_page(dialog) -> QWidget:
     """开发者选项 — Fluent Design"""
     scroll = QScrollArea()
     scroll.setWidgetResizable(True)
-    scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+    scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
     view = QWidget()
-    view.setStyleSheet("background: transparent;")
+    view.setStyleSheet(TRANSPARENT_STYLE)
     layout = QVBoxLayout(view)
     layout.setContentsMargins(0, 0, 10, 0)
     layout.setSpacing(20)
@@ -34,14 +62,13 @@ def create_developer_page(dialog) -> QWidget:
         parent=grp_stitch,
     )
     dialog.engine_combo = ComboBox(engine_card)
-    dialog.engine_combo.addItems([dialog.tr("Rust Hash (Recommended)")])
-    dialog.engine_combo.setItemData(0, "hash_rust")
-    dialog.engine_combo.setFixedWidth(200)
-    dialog.engine_combo.setCurrentIndex(0)
-    engine_card.hBoxLayout.addWidget(
-        dialog.engine_combo, 0, Qt.AlignmentFlag.AlignRight
+    fill_combo(
+        dialog.engine_combo,
+        (("hash_rust", dialog.tr("Rust Hash (Recommended)")),),
+        dialog.config_manager.get_long_stitch_engine(),
     )
-    engine_card.hBoxLayout.addSpacing(16)
+    dialog.engine_combo.setFixedWidth(200)
+    add_card_control(engine_card, dialog.engine_combo)
     grp_stitch.addSettingCard(engine_card)
 
     # 滚动冷却
@@ -55,20 +82,18 @@ def create_developer_page(dialog) -> QWidget:
     dialog.cooldown_spinbox.setRange(0.05, 1.0)
     dialog.cooldown_spinbox.setSingleStep(0.01)
     dialog.cooldown_spinbox.setDecimals(2)
-    dialog.cooldown_spinbox.setValue(
-        dialog.config_manager.settings.value(
-            "screenshot/scroll_cooldown", 0.15, type=float
-        )
-    )
+    dialog.cooldown_spinbox.setValue(dialog.config_manager.get_scroll_cooldown())
     dialog.cooldown_spinbox.setFixedWidth(110)
-    cooldown_card.hBoxLayout.addWidget(
-        dialog.cooldown_spinbox, 0, Qt.AlignmentFlag.AlignRight
-    )
-    cooldown_card.hBoxLayout.addSpacing(16)
+    add_card_control(cooldown_card, dialog.cooldown_spinbox)
     grp_stitch.addSettingCard(cooldown_card)
 
     layout.addWidget(grp_stitch)
 
+    app_values = dialog.config_manager.get_app_settings(
+        {cfg_key: True for *_, cfg_key in _PRELOAD_ITEMS}
+        | {"screenshot_info_hide_on_drag": False, "native_file_dialog": False}
+    )
+
     # ════ 工具 ════
     grp_tools = SettingCardGroup(dialog.tr("Tools"), view)
 
@@ -80,12 +105,19 @@ def create_developer_page(dialog) -> QWidget:
     )
     btn_wizard = PrimaryPushButton(dialog.tr("Open Wizard"), wizard_card)
     btn_wizard.clicked.connect(dialog._open_welcome_wizard)
-    wizard_card.hBoxLayout.addWidget(
-        btn_wizard, 0, Qt.AlignmentFlag.AlignRight
-    )
-    wizard_card.hBoxLayout.addSpacing(16)
+    add_card_control(wizard_card, btn_wizard)
     grp_tools.addSettingCard(wizard_card)
 
+    native_dialog_card = SwitchSettingCard(
+        FluentIcon.FOLDER,
+        dialog.tr("Native Folder Picker"),
+        dialog.tr("Use the system folder dialog. The built-in dialog opens faster."),
+        parent=grp_tools,
+    )
+    native_dialog_card.setChecked(app_values["native_file_dialog"])
+    dialog.native_file_dialog_toggle = native_dialog_card
+    grp_tools.addSettingCard(native_dialog_card)
+
     layout.addWidget(grp_tools)
 
     # ════ 启动预加载 ════
@@ -99,36 +131,11 @@ def create_developer_page(dialog) -> QWidget:
     preload_desc.setStyleSheet("padding: 0 0 4px 0;")
     layout.addWidget(preload_desc)
 
-    _preload_items = [
-        ("preload_fonts_toggle", FluentIcon.FONT,
-         dialog.tr("Preload Fonts"),
-         dialog.tr("Pre-scan system font list on startup"),
-         "preload_fonts"),
-        ("preload_screenshot_toggle", FluentIcon.CAMERA,
-         dialog.tr("Preload Screenshot Modules"),
-         dialog.tr("Pre-load mss, canvas, tools in background thread"),
-         "preload_screenshot"),
-        ("preload_toolbar_toggle", FluentIcon.LAYOUT,
-         dialog.tr("Preload Toolbar"),
-         dialog.tr("Pre-create toolbar widgets to avoid first-capture lag"),
-         "preload_toolbar"),
-        ("preload_ocr_toggle", FluentIcon.SEARCH,
-         dialog.tr("Preload OCR Engine"),
-         dialog.tr("Pre-load OCR model in background thread"),
-         "preload_ocr"),
-        ("preload_settings_toggle", FluentIcon.SETTING,
-         dialog.tr("Preload Settings Window"),
-         dialog.tr("Pre-create the settings dialog on startup"),
-         "preload_settings"),
-        ("preload_clipboard_toggle", FluentIcon.PASTE,
-         dialog.tr("Preload Clipboard Manager"),
-         dialog.tr("Initialize clipboard monitoring on startup"),
-         "preload_clipboard"),
-    ]
-
-    for attr_name, icon, title, desc, cfg_key in _preload_items:
-        card = SwitchSettingCard(icon, title, desc, parent=grp_preload)
-        card.setChecked(dialog.config_manager.get_app_setting(cfg_key, True))
+    for attr_name, icon, title, desc, cfg_key in _PRELOAD_ITEMS:
+        card = SwitchSettingCard(
+            icon, dialog.tr(title), dialog.tr(desc), parent=grp_preload
+        )
+        card.setChecked(app_values[cfg_key])
         setattr(dialog, attr_name, card)
         grp_preload.addSettingCard(card)
 
@@ -143,11 +150,7 @@ def create_developer_page(dialog) -> QWidget:
         dialog.tr("Hide the info panel while dragging the selection area"),
         parent=grp_panel,
     )
-    hide_card.setChecked(
-        dialog.config_manager.get_app_setting(
-            "screenshot_info_hide_on_drag", False
-        )
-    )
+    hide_card.setChecked(app_values["screenshot_info_hide_on_drag"])
     dialog.info_hide_on_drag_toggle = hide_card
     grp_panel.addSettingCard(hide_card)
 
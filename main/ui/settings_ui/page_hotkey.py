@@ -1,5 +1,7 @@
 ﻿# -*- coding: utf-8 -*-
 """快捷键设置页 — Fluent Design"""
+from functools import partial
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea,
     QStackedWidget,
@@ -10,7 +12,10 @@ from ui.dialogs import show_confirm_dialog
 from qfluentwidgets import (
     ComboBox, CaptionLabel, SegmentedWidget,
 )
-from .components import SettingCardGroup, WhiteCard, LBL_STYLE, theme_text_style
+from .components import (
+    SettingCardGroup, WhiteCard, FormRow, fill_combo, mark_styled_input,
+    SCROLL_AREA_STYLE, TRANSPARENT_RULE,
+)
 from ..hotkey_edit import HotkeyEdit
 from ..inapp_key_edit import InAppKeyEdit
 
@@ -37,9 +42,6 @@ INAPP_KEYS = SCREENSHOT_KEYS + PIN_KEYS
 
 _EDIT_W = 140
 _EDIT_H = 28
-_CARD_LABEL_STYLE = theme_text_style(14)
-_ROW_TITLE_STYLE = theme_text_style(13)
-_SEGMENT_HINT_STYLE = "font-size: 12px; background: transparent;"
 
 
 def _build_shortcut_row(dialog, parent, title: str, editor: QWidget) -> QWidget:
@@ -52,7 +54,7 @@ def _build_shortcut_row(dialog, parent, title: str, editor: QWidget) -> QWidget:
     row_layout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
 
     title_label = QLabel(title, row_card)
-    title_label.setStyleSheet(_ROW_TITLE_STYLE)
+    title_label.setProperty("role", "rowTitle")
     row_layout.addWidget(title_label, 1)
     row_layout.addWidget(editor, 0, Qt.AlignmentFlag.AlignRight)
     return row_card
@@ -66,78 +68,43 @@ def create_hotkey_page(dialog) -> QWidget:
     """创建快捷键设置页面 — Fluent Design"""
     scroll = QScrollArea()
     scroll.setWidgetResizable(True)
-    scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+    scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
     view = QWidget()
-    view.setStyleSheet("background: transparent;")
+    # 透明背景与统一输入框样式合在一张样式表里，只解析一次
+    view.setStyleSheet(TRANSPARENT_RULE + dialog._get_input_style())
     layout = QVBoxLayout(view)
     layout.setContentsMargins(0, 0, 10, 0)
     layout.setSpacing(20)
 
-    input_style = dialog._get_input_style()
-
     # ════ 全局热键 ════
     grp_global = SettingCardGroup(dialog.tr("Global Hotkeys"), view)
 
     # 截图热键（主 + 备用）
-    ss_card = WhiteCard(grp_global)
-    ss_h = QHBoxLayout(ss_card)
-    ss_h.setContentsMargins(20, 8, 20, 8)
-    ss_h.setSpacing(12)
-
-    ss_lbl = QLabel(dialog.tr("Screenshot Hotkey"), ss_card)
-    ss_lbl.setStyleSheet(_CARD_LABEL_STYLE)
-    ss_h.addWidget(ss_lbl)
-    ss_h.addStretch()
-
-    ss_v = QVBoxLayout()
-    ss_v.setSpacing(5)
     dialog.hotkey_input = HotkeyEdit()
     dialog.hotkey_input.setText(dialog.current_hotkey)
-    dialog.hotkey_input.setPlaceholderText(dialog.tr("e.g.: ctrl+shift+a"))
-    dialog.hotkey_input.setFixedWidth(200)
-    dialog.hotkey_input.setStyleSheet(input_style)
-    ss_v.addWidget(dialog.hotkey_input)
-
     dialog.hotkey_input_2 = HotkeyEdit()
     dialog.hotkey_input_2.setText(dialog.config_manager.get_hotkey_2())
-    dialog.hotkey_input_2.setPlaceholderText(dialog.tr("e.g.: ctrl+shift+a"))
-    dialog.hotkey_input_2.setFixedWidth(200)
-    dialog.hotkey_input_2.setStyleSheet(input_style)
-    ss_v.addWidget(dialog.hotkey_input_2)
-    ss_h.addLayout(ss_v)
-    ss_card.setFixedHeight(80)
-    grp_global.addSettingCard(ss_card)
 
     # 剪贴板热键（主 + 备用）
-    cb_card = WhiteCard(grp_global)
-    cb_h = QHBoxLayout(cb_card)
-    cb_h.setContentsMargins(20, 8, 20, 8)
-    cb_h.setSpacing(12)
-
-    cb_lbl = QLabel(dialog.tr("Clipboard Hotkey"), cb_card)
-    cb_lbl.setStyleSheet(_CARD_LABEL_STYLE)
-    cb_h.addWidget(cb_lbl)
-    cb_h.addStretch()
-
-    cb_v = QVBoxLayout()
-    cb_v.setSpacing(5)
     dialog.clipboard_hotkey_edit = HotkeyEdit()
     dialog.clipboard_hotkey_edit.setText(dialog.config_manager.get_clipboard_hotkey())
-    dialog.clipboard_hotkey_edit.setPlaceholderText(dialog.tr("e.g.: ctrl+shift+a"))
-    dialog.clipboard_hotkey_edit.setFixedWidth(200)
-    dialog.clipboard_hotkey_edit.setStyleSheet(input_style)
-    cb_v.addWidget(dialog.clipboard_hotkey_edit)
-
     dialog.clipboard_hotkey_edit_2 = HotkeyEdit()
     dialog.clipboard_hotkey_edit_2.setText(dialog.config_manager.get_clipboard_hotkey_2())
-    dialog.clipboard_hotkey_edit_2.setPlaceholderText(dialog.tr("e.g.: ctrl+shift+a"))
-    dialog.clipboard_hotkey_edit_2.setFixedWidth(200)
-    dialog.clipboard_hotkey_edit_2.setStyleSheet(input_style)
-    cb_v.addWidget(dialog.clipboard_hotkey_edit_2)
-    cb_h.addLayout(cb_v)
-    cb_card.setFixedHeight(80)
-    grp_global.addSettingCard(cb_card)
+
+    for edit in (dialog.hotkey_input, dialog.hotkey_input_2,
+                 dialog.clipboard_hotkey_edit, dialog.clipboard_hotkey_edit_2):
+        edit.setPlaceholderText(dialog.tr("e.g.: ctrl+shift+a"))
+        edit.setFixedWidth(200)
+        mark_styled_input(edit)
+
+    for title, edits in (
+        (dialog.tr("Screenshot Hotkey"), (dialog.hotkey_input, dialog.hotkey_input_2)),
+        (dialog.tr("Clipboard Hotkey"), (dialog.clipboard_hotkey_edit, dialog.clipboard_hotkey_edit_2)),
+    ):
+        row = FormRow(title, *edits, parent=grp_global)
+        row.setFixedHeight(80)
+        grp_global.addSettingCard(row)
 
     layout.addWidget(grp_global)
 
@@ -169,7 +136,7 @@ def create_hotkey_page(dialog) -> QWidget:
         for cfg_key, tr_src, default in keys_list:
             edit = InAppKeyEdit()
             edit.setFixedSize(_EDIT_W, _EDIT_H)
-            edit.setStyleSheet(input_style)
+            mark_styled_input(edit)
             edit.setText(
                 dialog.config_manager.get_inapp_shortcut(cfg_key) or default
             )
@@ -188,14 +155,11 @@ def create_hotkey_page(dialog) -> QWidget:
     # 鼠标微移模式
     dialog.cursor_move_combo = ComboBox()
     dialog.cursor_move_combo.setFixedSize(_EDIT_W, _EDIT_H)
-    dialog.cursor_move_combo.addItem("WASD + ↑↓←→", userData="both")
-    dialog.cursor_move_combo.addItem("↑↓←→", userData="arrows")
-    dialog.cursor_move_combo.addItem("WASD", userData="wasd")
-
-    cur_mode = dialog.config_manager.get_inapp_cursor_move_mode()
-    idx = dialog.cursor_move_combo.findData(cur_mode)
-    if idx >= 0:
-        dialog.cursor_move_combo.setCurrentIndex(idx)
+    fill_combo(
+        dialog.cursor_move_combo,
+        (("both", "WASD + ↑↓←→"), ("arrows", "↑↓←→"), ("wasd", "WASD")),
+        dialog.config_manager.get_inapp_cursor_move_mode(),
+    )
 
     move_row = _build_shortcut_row(
         dialog, tab_card, dialog.tr("Cursor Move Keys"), dialog.cursor_move_combo
@@ -223,12 +187,9 @@ def create_hotkey_page(dialog) -> QWidget:
     grp_inapp.addSettingCard(tab_card)
 
     # 冲突检测
+    # partial 直接绑定 (dialog, key)，每次按键不再多经过一层 lambda 帧
     for cfg_key, edit in dialog._inapp_edits.items():
-        edit.textChanged.connect(
-            lambda text, k=cfg_key: _on_shortcut_changed(
-                dialog, k, text, input_style
-            )
-        )
+        edit.textChanged.connect(partial(_on_shortcut_changed, dialog, cfg_key))
 
     layout.addWidget(grp_inapp)
 
@@ -237,7 +198,7 @@ def create_hotkey_page(dialog) -> QWidget:
         dialog.tr("💡 Hint: Click the input box and press the desired key combination."),
         view,
     )
-    hint.setStyleSheet("padding: 5px;")
+    hint.setObjectName("SettingsHint")
     layout.addWidget(hint)
 
     layout.addStretch()
@@ -247,7 +208,7 @@ def create_hotkey_page(dialog) -> QWidget:
 
 # ── 输入后冲突检测（交互式弹窗）──────────────────────────
 
-def _on_shortcut_changed(dialog, changed_key: str, new_text: str, base_style: str):
+def _on_shortcut_changed(dialog, changed_key: str, new_text: str):
     """某个输入框值变化时，检查同组内是否冲突，弹窗询问是否替换"""
     new_text = new_text.strip().lower()
     # 忽略空值、未完成的中间态（如 "ctrl+"）
@@ -1,40 +1,41 @@
 ﻿# -*- coding: utf-8 -*-
 """日志设置页 — Fluent Design"""
 import os
-import subprocess
-import sys
-import glob
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea,
 )
-from PySide6.QtCore import Qt
 from ui.dialogs import show_info_dialog
+from core.logger import get_logger
 from qfluentwidgets import (
     SwitchSettingCard, SettingCard as FSettingCard,
     FluentIcon, ComboBox, SpinBox,
     CaptionLabel, PushButton,
 )
-from .components import SettingCardGroup, WhiteCard, theme_text_style, theme_caption_style
-
-
-_CARD_TITLE_STYLE = theme_text_style(14)
-_CARD_CAPTION_STYLE = theme_caption_style(12)
-_CARD_MUTED_STYLE = theme_caption_style(12)
+from .components import (
+    SettingCardGroup, WhiteCard, open_path, add_card_control, SCROLL_AREA_STYLE, TRANSPARENT_STYLE,
+)
 
 
 def create_log_page(dialog) -> QWidget:
     """创建日志设置页面 — Fluent Design"""
     scroll = QScrollArea()
     scroll.setWidgetResizable(True)
-    scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+    scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
     view = QWidget()
-    view.setStyleSheet("background: transparent;")
+    view.setStyleSheet(TRANSPARENT_STYLE)
     layout = QVBoxLayout(view)
     layout.setContentsMargins(0, 0, 10, 0)
     layout.setSpacing(20)
 
+    app_values = dialog.config_manager.get_app_settings({
+        "log_enabled": None,
+        "log_level": None,
+        "log_retention_days": None,
+        "log_dir": None,
+    })
+
     # ════ 日志设置 ════
     grp_log = SettingCardGroup(dialog.tr("Log Settings"), view)
 
@@ -45,7 +46,7 @@ def create_log_page(dialog) -> QWidget:
         dialog.tr("Saves app activity logs to file."),
         parent=grp_log,
     )
-    log_card.setChecked(dialog.config_manager.get_log_enabled())
+    log_card.setChecked(app_values["log_enabled"])
     dialog.log_toggle = log_card
     grp_log.addSettingCard(log_card)
 
@@ -57,21 +58,12 @@ def create_log_page(dialog) -> QWidget:
         parent=grp_log,
     )
     dialog.log_level_combo = ComboBox(level_card)
+    # 等级名本身即唯一标识（保存时读 currentText），无需再存 itemData
     dialog.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR"])
-    dialog.log_level_combo.setItemData(0, "DEBUG")
-    dialog.log_level_combo.setItemData(1, "INFO")
-    dialog.log_level_combo.setItemData(2, "WARNING")
-    dialog.log_level_combo.setItemData(3, "ERROR")
     dialog.log_level_combo.setFixedWidth(130)
-    current_level = dialog.config_manager.get_log_level()
-    level_idx = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}.get(
-        current_level, 2
-    )
-    dialog.log_level_combo.setCurrentIndex(level_idx)
-    level_card.hBoxLayout.addWidget(
-        dialog.log_level_combo, 0, Qt.AlignmentFlag.AlignRight
-    )
-    level_card.hBoxLayout.addSpacing(16)
+    level_idx = dialog.log_level_combo.findText(app_values["log_level"])
+    dialog.log_level_combo.setCurrentIndex(level_idx if level_idx >= 0 else 2)
+    add_card_control(level_card, dialog.log_level_combo)
     grp_log.addSettingCard(level_card)
 
     # 保留天数
@@ -84,14 +76,9 @@ def create_log_page(dialog) -> QWidget:
     dialog.log_retention_spinbox = SpinBox(retention_card)
     dialog.log_retention_spinbox.setRange(0, 365)
     dialog.log_retention_spinbox.setSuffix(" " + dialog.tr("days"))
-    dialog.log_retention_spinbox.setValue(
-        dialog.config_manager.get_log_retention_days()
-    )
+    dialog.log_retention_spinbox.setValue(app_values["log_retention_days"])
     dialog.log_retention_spinbox.setFixedWidth(150)
-    retention_card.hBoxLayout.addWidget(
-        dialog.log_retention_spinbox, 0, Qt.AlignmentFlag.AlignRight
-    )
-    retention_card.hBoxLayout.addSpacing(16)
+    add_card_control(retention_card, dialog.log_retention_spinbox)
     grp_log.addSettingCard(retention_card)
 
     layout.addWidget(grp_log)
@@ -105,16 +92,16 @@ def create_log_page(dialog) -> QWidget:
     path_v.setSpacing(8)
 
     path_title = QLabel(dialog.tr("Save Location:"), path_card)
-    path_title.setStyleSheet(_CARD_TITLE_STYLE)
+    path_title.setProperty("role", "cardTitle")
     path_v.addWidget(path_title)
 
-    dialog.path_lbl = QLabel(dialog.config_manager.get_log_dir(), path_card)
+    dialog.path_lbl = QLabel(app_values["log_dir"], path_card)
     dialog.path_lbl.setWordWrap(True)
-    dialog.path_lbl.setStyleSheet(_CARD_CAPTION_STYLE)
+    dialog.path_lbl.setProperty("role", "caption")
     path_v.addWidget(dialog.path_lbl)
 
     dialog.latest_log_lbl = QLabel("", path_card)
-    dialog.latest_log_lbl.setStyleSheet(_CARD_MUTED_STYLE)
+    dialog.latest_log_lbl.setProperty("role", "caption")
     dialog.latest_log_lbl.setWordWrap(True)
     refresh_latest_log_label(dialog)
     path_v.addWidget(dialog.latest_log_lbl)
@@ -153,7 +140,6 @@ def create_log_page(dialog) -> QWidget:
 def refresh_latest_log_label(dialog):
     """刷新当前/最新日志文件路径显示"""
     try:
-        from core.logger import get_logger
         logger = get_logger()
         log_path = None
         if getattr(logger, "log_file", None) is not None:
@@ -176,17 +162,19 @@ def _open_latest_log_file(dialog):
     if not os.path.exists(path):
         os.makedirs(path, exist_ok=True)
 
-    pattern = os.path.join(path, "runtime_*.log")
-    files = glob.glob(pattern)
-    if not files:
+    # 单次 scandir 遍历：名称过滤 + 每个文件只 stat 一次
+    latest, latest_mtime = None, -1.0
+    with os.scandir(path) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("runtime_") and name.endswith(".log"):
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest, latest_mtime = entry.path, mtime
+
+    if latest is None:
         show_info_dialog(dialog, dialog.tr("Log"), dialog.tr("No log files yet. Please start and use the app first."))
         return
 
-    latest = max(files, key=os.path.getmtime)
-    if sys.platform == "win32":
-        os.startfile(latest)
-    elif sys.platform == "darwin":
-        subprocess.run(["open", latest], check=False)
-    else:
-        subprocess.run(["xdg-open", latest], check=False)
+    open_path(latest)
  
\ No newline at end of file
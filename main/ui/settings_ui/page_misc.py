@@ -1,22 +1,22 @@
 ﻿# -*- coding: utf-8 -*-
 """杂项设置页 — Fluent Design"""
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QScrollArea
-from PySide6.QtCore import Qt
+from core.i18n import I18nManager
 from qfluentwidgets import (
     SwitchSettingCard, SettingCard as FSettingCard,
     FluentIcon, ComboBox, CaptionLabel,
 )
-from .components import SettingCardGroup
+from .components import SettingCardGroup, fill_combo, add_card_control, SCROLL_AREA_STYLE, TRANSPARENT_STYLE
 
 
 def create_misc_page(dialog) -> QWidget:
     """创建杂项设置页面 — Fluent Design"""
     scroll = QScrollArea()
     scroll.setWidgetResizable(True)
-    scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+    scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
     view = QWidget()
-    view.setStyleSheet("background: transparent;")
+    view.setStyleSheet(TRANSPARENT_STYLE)
     layout = QVBoxLayout(view)
     layout.setContentsMargins(0, 0, 10, 0)
     layout.setSpacing(20)
@@ -36,6 +36,12 @@ def create_misc_page(dialog) -> QWidget:
     dialog.autostart_toggle = autostart_card
     grp_startup.addSettingCard(autostart_card)
 
+    app_values = dialog.config_manager.get_app_settings({
+        "show_main_window": None,
+        "magnifier_color_copy_format": "rgb_hex",
+        "language": "ja",
+    })
+
     # 主界面显示
     show_card = SwitchSettingCard(
         FluentIcon.APPLICATION,
@@ -43,7 +49,7 @@ def create_misc_page(dialog) -> QWidget:
         dialog.tr("If off, starts in background."),
         parent=grp_startup,
     )
-    show_card.setChecked(dialog.config_manager.get_show_main_window())
+    show_card.setChecked(app_values["show_main_window"])
     dialog.show_main_window_toggle = show_card
     grp_startup.addSettingCard(show_card)
 
@@ -78,20 +84,16 @@ def create_misc_page(dialog) -> QWidget:
     )
     dialog.magnifier_color_format_combo = ComboBox(fmt_card)
     dialog.magnifier_color_format_combo.setFixedWidth(140)
-    dialog.magnifier_color_format_combo.addItem(dialog.tr("RGB+HEX"), userData="rgb_hex")
-    dialog.magnifier_color_format_combo.addItem(dialog.tr("RGB only"), userData="rgb")
-    dialog.magnifier_color_format_combo.addItem(dialog.tr("HEX only"), userData="hex")
-
-    current_format = dialog.config_manager.get_app_setting(
-        "magnifier_color_copy_format", "rgb_hex"
+    fill_combo(
+        dialog.magnifier_color_format_combo,
+        (
+            ("rgb_hex", dialog.tr("RGB+HEX")),
+            ("rgb", dialog.tr("RGB only")),
+            ("hex", dialog.tr("HEX only")),
+        ),
+        app_values["magnifier_color_copy_format"],
     )
-    idx = dialog.magnifier_color_format_combo.findData(current_format)
-    if idx >= 0:
-        dialog.magnifier_color_format_combo.setCurrentIndex(idx)
-    fmt_card.hBoxLayout.addWidget(
-        dialog.magnifier_color_format_combo, 0, Qt.AlignmentFlag.AlignRight
-    )
-    fmt_card.hBoxLayout.addSpacing(16)
+    add_card_control(fmt_card, dialog.magnifier_color_format_combo)
     grp_ops.addSettingCard(fmt_card)
 
     # 界面语言
@@ -102,20 +104,16 @@ def create_misc_page(dialog) -> QWidget:
         parent=grp_ops,
     )
     dialog.language_combo = ComboBox(lang_card)
+    # 记下打开时的语言，accept 时直接比较，不必再读一次 QSettings
+    dialog._initial_lang = app_values["language"]
     dialog.language_combo.setFixedWidth(140)
 
-    from core.i18n import I18nManager
-    for code, name in I18nManager.get_available_languages().items():
-        dialog.language_combo.addItem(name, userData=code)
-
-    current_lang = dialog.config_manager.get_app_setting("language", "ja")
-    index = dialog.language_combo.findData(current_lang)
-    if index >= 0:
-        dialog.language_combo.setCurrentIndex(index)
-    lang_card.hBoxLayout.addWidget(
-        dialog.language_combo, 0, Qt.AlignmentFlag.AlignRight
+    fill_combo(
+        dialog.language_combo,
+        I18nManager.get_available_languages().items(),
+        app_values["language"],
     )
-    lang_card.hBoxLayout.addSpacing(16)
+    add_card_control(lang_card, dialog.language_combo)
     grp_ops.addSettingCard(lang_card)
 
     layout.addWidget(grp_ops)
@@ -125,7 +123,7 @@ def create_misc_page(dialog) -> QWidget:
         dialog.tr("💡 Hint: Even with background startup, you can operate from system tray."),
         view,
     )
-    hint.setStyleSheet("padding: 5px;")
+    hint.setObjectName("SettingsHint")
     layout.addWidget(hint)
 
     layout.addStretch()
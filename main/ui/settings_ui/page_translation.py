@@ -4,32 +4,43 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QLabel,
     QScrollArea,
 )
-from PySide6.QtCore import Qt
 from qfluentwidgets import (
     SwitchSettingCard, SettingCard as FSettingCard,
     FluentIcon, ComboBox, CaptionLabel,
     PushButton, HyperlinkButton,
 )
-from .components import SettingCardGroup, WhiteCard, adjust_button_width, theme_text_style
+from .components import (
+    SettingCardGroup, WhiteCard, adjust_button_width, fill_combo, mark_styled_input,
+    add_card_control, SCROLL_AREA_STYLE, TRANSPARENT_RULE,
+)
 
 from translation.languages import TRANSLATION_LANGUAGES
 
-
-_CARD_TITLE_STYLE = theme_text_style(14)
+# 目标语言选项（原生名称无需翻译），模块加载时生成一次
+_TARGET_LANG_OPTIONS = tuple(TRANSLATION_LANGUAGES.items())
 
 
 def create_translation_page(dialog) -> QWidget:
     """创建翻译设置页面 — Fluent Design"""
     scroll = QScrollArea()
     scroll.setWidgetResizable(True)
-    scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+    scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
     page = QWidget()
-    page.setStyleSheet("background: transparent;")
+    # 透明背景与统一输入框样式合在一张样式表里，只解析一次
+    page.setStyleSheet(TRANSPARENT_RULE + dialog._get_input_style())
     layout = QVBoxLayout(page)
     layout.setContentsMargins(0, 0, 10, 0)
     layout.setSpacing(20)
 
+    app_values = dialog.config_manager.get_app_settings({
+        "deepl_api_key": None,
+        "deepl_use_pro": None,
+        "translation_target_lang": "",
+        "translation_split_sentences": None,
+        "translation_preserve_formatting": None,
+    })
+
     # ════ DeepL API ════
     grp_api = SettingCardGroup(dialog.tr("DeepL API"), page)
 
@@ -40,7 +51,7 @@ def create_translation_page(dialog) -> QWidget:
     key_h.setSpacing(10)
 
     key_lbl = QLabel(dialog.tr("DeepL API Key"), key_card)
-    key_lbl.setStyleSheet(_CARD_TITLE_STYLE)
+    key_lbl.setProperty("role", "cardTitle")
     key_lbl.setFixedWidth(100)
     key_h.addWidget(key_lbl)
 
@@ -48,9 +59,9 @@ def create_translation_page(dialog) -> QWidget:
     dialog.deepl_api_key_input.setPlaceholderText(
         "xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx:fx"
     )
-    dialog.deepl_api_key_input.setText(dialog.config_manager.get_deepl_api_key())
+    dialog.deepl_api_key_input.setText(app_values["deepl_api_key"])
     dialog.deepl_api_key_input.setEchoMode(QLineEdit.EchoMode.Password)
-    dialog.deepl_api_key_input.setStyleSheet(dialog._get_input_style())
+    mark_styled_input(dialog.deepl_api_key_input)
     key_h.addWidget(dialog.deepl_api_key_input, 1)
 
     dialog.show_api_key_btn = PushButton(dialog.tr("Show"), key_card)
@@ -70,7 +81,7 @@ def create_translation_page(dialog) -> QWidget:
         dialog.tr("Enable if you have a paid DeepL subscription"),
         parent=grp_api,
     )
-    pro_card.setChecked(dialog.config_manager.get_deepl_use_pro())
+    pro_card.setChecked(app_values["deepl_use_pro"])
     dialog.deepl_pro_toggle = pro_card
     grp_api.addSettingCard(pro_card)
 
@@ -88,22 +99,13 @@ def create_translation_page(dialog) -> QWidget:
     dialog.translation_target_combo = ComboBox(lang_card)
     dialog.translation_target_combo.setFixedWidth(180)
 
-    lang_options = [("", dialog.tr("Auto (System)"))]
-    lang_options.extend(list(TRANSLATION_LANGUAGES.items()))
-    current_lang = dialog.config_manager.get_app_setting(
-        "translation_target_lang", ""
+    fill_combo(
+        dialog.translation_target_combo,
+        [("", dialog.tr("Auto (System)")), *_TARGET_LANG_OPTIONS],
+        app_values["translation_target_lang"],
     )
-    current_index = 0
-    for i, (code, name) in enumerate(lang_options):
-        dialog.translation_target_combo.addItem(name, userData=code)
-        if code == current_lang:
-            current_index = i
-    dialog.translation_target_combo.setCurrentIndex(current_index)
-
-    lang_card.hBoxLayout.addWidget(
-        dialog.translation_target_combo, 0, Qt.AlignmentFlag.AlignRight
-    )
-    lang_card.hBoxLayout.addSpacing(16)
+
+    add_card_control(lang_card, dialog.translation_target_combo)
     grp_opts.addSettingCard(lang_card)
 
     # 忽略换行
@@ -113,7 +115,7 @@ def create_translation_page(dialog) -> QWidget:
         dialog.tr("Merge multi-line text for better translation"),
         parent=grp_opts,
     )
-    split_card.setChecked(dialog.config_manager.get_translation_split_sentences())
+    split_card.setChecked(app_values["translation_split_sentences"])
     dialog.split_sentences_toggle = split_card
     grp_opts.addSettingCard(split_card)
 
@@ -124,9 +126,7 @@ def create_translation_page(dialog) -> QWidget:
         dialog.tr("Keep original text formatting"),
         parent=grp_opts,
     )
-    preserve_card.setChecked(
-        dialog.config_manager.get_translation_preserve_formatting()
-    )
+    preserve_card.setChecked(app_values["translation_preserve_formatting"])
     dialog.preserve_formatting_toggle = preserve_card
     grp_opts.addSettingCard(preserve_card)
 
@@ -139,7 +139,7 @@ def create_translation_page(dialog) -> QWidget:
         page,
     )
     info_label.setOpenExternalLinks(True)
-    info_label.setStyleSheet("padding: 5px; font-size: 12px; color: #999;")
+    info_label.setObjectName("SettingsInfoNote")
     layout.addWidget(info_label)
 
     layout.addStretch()
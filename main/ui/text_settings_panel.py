@@ -3,12 +3,13 @@
 提供字体、字号、颜色、描边、阴影等高级设置
 """
 import time
+from functools import partial
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QLabel,
     QComboBox, QCheckBox, QFrame, QButtonGroup,
     QSlider, QApplication
 )
-from PySide6.QtCore import Qt, Signal, QSize, QEvent, QTimer, QPoint
+from PySide6.QtCore import Qt, Signal, QSize, QEvent, QTimer, QPoint, QStringListModel
 from PySide6.QtGui import QIcon, QColor, QFont, QFontDatabase
 from .base_settings_panel import StepperWidget, build_settings_panel_stylesheet, paint_rounded_panel, PANEL_SCALE
 from .color_picker_button import ColorPickerButton
@@ -16,6 +17,49 @@ from core.constants import CSS_FONT_FAMILY, DEFAULT_FONT_FAMILY
 from core import safe_event
 from core.logger import log_exception
 
+# 系统字体列表进程内只枚举一次（首次调用 QFontDatabase.families() 很慢），所有面板实例共用
+_cached_families = None
+_cached_family_set = None
+_cached_sorted_families = None
+_font_model = None
+
+# 常用中文字体排在下拉列表前面
+_PRIORITY_FONTS = (DEFAULT_FONT_FAMILY, "SimSun", "SimHei", "KaiTi", "Arial", "Times New Roman")
+
+# 预设颜色：红、黄、绿、蓝、黑、白
+_PRESET_COLORS = ("#FF0000", "#FFFF00", "#00FF00", "#0000FF", "#000000", "#FFFFFF")
+# 预先解析好的 QColor，点击时只做廉价复制，不再解析十六进制字符串
+_PRESET_QCOLORS = {c: QColor(c) for c in _PRESET_COLORS}
+
+
+def _get_font_families():
+    """获取系统字体列表及其集合（带内存缓存）。返回 (families, family_set)。"""
+    global _cached_families, _cached_family_set
+    if _cached_families is None:
+        _cached_families = QFontDatabase.families()
+        _cached_family_set = frozenset(_cached_families)
+    return _cached_families, _cached_family_set
+
+
+def _get_sorted_font_families():
+    """获取下拉列表用的字体顺序：优先字体在前，其余按系统顺序（带内存缓存）。"""
+    global _cached_sorted_families
+    if _cached_sorted_families is None:
+        families, family_set = _get_font_families()
+        priority = [f for f in _PRIORITY_FONTS if f in family_set]
+        priority_set = set(priority)
+        _cached_sorted_families = tuple(priority + [f for f in families if f not in priority_set])
+    return _cached_sorted_families
+
+
+def _get_font_model():
+    """获取字体下拉列表共用的数据模型（进程内只构建一次，各面板的下拉框共享）。"""
+    global _font_model
+    if _font_model is None:
+        _font_model = QStringListModel(list(_get_sorted_font_families()))
+    return _font_model
+
+
 class TextSettingsPanel(QWidget):
     """文字工具二级菜单"""
     
@@ -23,34 +67,81 @@ class TextSettingsPanel(QWidget):
     font_changed = Signal(QFont)
     color_changed = Signal(QColor)
     background_changed = Signal(bool, QColor, int)
+
+    # 面板样式表只拼接一次，所有实例共用同一字符串；
+    # 预设色块与 B/I/U 按钮的样式按动态属性匹配，不再逐个 setStyleSheet
+    _PANEL_QSS = build_settings_panel_stylesheet(
+        combo_enabled=True,
+        combo_padding="2px 8px 2px 4px",
+        combo_min_width=40,
+        combo_max_width=120
+    ) + f"""
+        QCheckBox {{
+            spacing: 5px;
+            background-color: transparent;
+            border: none;
+            font-family: {CSS_FONT_FAMILY};
+            font-size: 12px;
+            color: #333;
+        }}
+        QPushButton[textStyle] {{
+            font-size: 14px;
+            font-family: Arial, sans-serif;
+        }}
+        QPushButton[textStyle="bold"] {{
+            font-weight: bold;
+        }}
+        QPushButton[textStyle="italic"] {{
+            font-style: italic;
+        }}
+        QPushButton[textStyle="underline"] {{
+            text-decoration: underline;
+        }}
+        QPushButton[presetColor="true"] {{
+            border: 1px solid #333333;
+            border-radius: 6px;
+        }}
+        QPushButton[presetColor="true"][lightColor="true"] {{
+            border: 1px solid #888888;
+        }}
+        QPushButton[presetColor="true"]:hover {{
+            border: 2px solid #000;
+        }}
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         # 使用更安全的默认字体选择
         default_font_family = DEFAULT_FONT_FAMILY
-        # 缓存字体列表，避免多次调用 QFontDatabase.families()（首次调用很慢）
-        self._cached_fonts = QFontDatabase.families()
-        if default_font_family not in self._cached_fonts:
+        families, family_set = _get_font_families()
+        if default_font_family not in family_set:
             # fallback到系统可用的字体
-            if "Arial" in self._cached_fonts:
+            if "Arial" in family_set:
                 default_font_family = "Arial"
-            elif "SimSun" in self._cached_fonts:
+            elif "SimSun" in family_set:
                 default_font_family = "SimSun"
-            elif len(self._cached_fonts) > 0:
-                default_font_family = self._cached_fonts[0]
+            elif len(families) > 0:
+                default_font_family = families[0]
         
         self.current_font = QFont(default_font_family, 16)
         self.current_color = QColor(Qt.GlobalColor.red)
         self.background_enabled = False
         self.background_color = QColor(255, 255, 255)
         self.background_opacity = 255
+        self._applying_state = False  # _apply_font_to_controls 同步控件期间为 True
+        self._background_color_dialog = None  # 首次选择背景色时创建，之后复用
         self._background_hover_btn = False
         self._background_hover_popup = False
         self._background_hide_timer = QTimer(self)
         self._background_hide_timer.setSingleShot(True)
         self._background_hide_timer.setInterval(150)
         self._background_hide_timer.timeout.connect(self._maybe_hide_background_popup)
+        # 字号连续调整（长按箭头/滚轮）时合并为一次字体更新
+        self._size_timer = QTimer(self)
+        self._size_timer.setSingleShot(True)
+        self._size_timer.setInterval(40)
+        self._size_timer.timeout.connect(self._on_font_changed)
         
         self._init_ui()
         self._connect_signals()
@@ -61,21 +152,7 @@ class TextSettingsPanel(QWidget):
 
     def _init_ui(self):
         """初始化UI布局"""
-        self.setStyleSheet(build_settings_panel_stylesheet(
-            combo_enabled=True,
-            combo_padding="2px 8px 2px 4px",
-            combo_min_width=40,
-            combo_max_width=120
-        ) + """
-            QCheckBox {
-                spacing: 5px;
-                background-color: transparent;
-                border: none;
-                font-family: {CSS_FONT_FAMILY};
-                font-size: 12px;
-                color: #333;
-            }
-        """)
+        self.setStyleSheet(self._PANEL_QSS)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(round(10 * PANEL_SCALE), round(8 * PANEL_SCALE),
@@ -86,23 +163,11 @@ class TextSettingsPanel(QWidget):
         
         # 字体选择 - 使用已缓存的字体列表
         self.font_combo = QComboBox()
-        # 过滤出常用中文字体放在前面
-        priority_fonts = [DEFAULT_FONT_FAMILY, "SimSun", "SimHei", "KaiTi", "Arial", "Times New Roman"]
-        sorted_fonts = []
-        # 先添加优先字体
-        for f in priority_fonts:
-            if f in self._cached_fonts:
-                sorted_fonts.append(f)
-        # 再添加其他字体
-        for f in self._cached_fonts:
-            if f not in sorted_fonts:
-                sorted_fonts.append(f)
-                
-        self.font_combo.addItems(sorted_fonts)
+        self.font_combo.setModel(_get_font_model())
         # 设置当前字体，如果不可用则使用第一个可用字体
-        if DEFAULT_FONT_FAMILY in sorted_fonts:
+        if DEFAULT_FONT_FAMILY in _get_font_families()[1]:
             self.font_combo.setCurrentText(DEFAULT_FONT_FAMILY)
-        elif len(sorted_fonts) > 0:
+        elif self.font_combo.count() > 0:
             self.font_combo.setCurrentIndex(0)
         self.font_combo.setToolTip(self.tr("Font"))
         
@@ -126,39 +191,21 @@ class TextSettingsPanel(QWidget):
         self.bold_btn.setFixedSize(_btn_sz, _btn_sz)
         self.bold_btn.setToolTip(self.tr("Bold"))
         # 使用CSS确保粗体效果，不依赖字体变体
-        self.bold_btn.setStyleSheet("""
-            QPushButton {
-                font-weight: bold;
-                font-size: 14px;
-                font-family: Arial, sans-serif;
-            }
-        """)
+        self.bold_btn.setProperty("textStyle", "bold")
         
         self.italic_btn = QPushButton("I")
         self.italic_btn.setCheckable(True)
         self.italic_btn.setFixedSize(_btn_sz, _btn_sz)
         self.italic_btn.setToolTip(self.tr("Italic"))
         # 使用CSS确保斜体效果
-        self.italic_btn.setStyleSheet("""
-            QPushButton {
-                font-style: italic;
-                font-size: 14px;
-                font-family: Arial, sans-serif;
-            }
-        """)
+        self.italic_btn.setProperty("textStyle", "italic")
         
         self.underline_btn = QPushButton("U")
         self.underline_btn.setCheckable(True)
         self.underline_btn.setFixedSize(_btn_sz, _btn_sz)
         self.underline_btn.setToolTip(self.tr("Underline"))
         # 使用CSS确保下划线效果
-        self.underline_btn.setStyleSheet("""
-            QPushButton {
-                text-decoration: underline;
-                font-size: 14px;
-                font-family: Arial, sans-serif;
-            }
-        """)
+        self.underline_btn.setProperty("textStyle", "underline")
         
         layout.addWidget(self.bold_btn)
         layout.addWidget(self.italic_btn)
@@ -188,38 +235,17 @@ class TextSettingsPanel(QWidget):
         self.color_btn.setToolTip(self.tr("Custom Color"))
         layout.addWidget(self.color_btn)
         
-        # 预设颜色按钮
-        preset_colors = [
-            "#FF0000", # 红色
-            "#FFFF00", # 黄色
-            "#00FF00", # 绿色
-            "#0000FF", # 蓝色
-            "#000000", # 黑色
-            "#FFFFFF", # 白色
-        ]
-        
+        # 预设颜色按钮：边框/悬停样式由面板样式表按属性匹配，按钮只设背景色
         _preset_sz = round(24 * PANEL_SCALE)
-        for color_str in preset_colors:
+        for color_str in _PRESET_COLORS:
             btn = QPushButton()
             btn.setFixedSize(_preset_sz, _preset_sz)
             btn.setToolTip(color_str)
+            btn.setProperty("presetColor", True)
+            btn.setProperty("lightColor", color_str == "#FFFFFF")
+            btn.setStyleSheet(f"background-color: {color_str};")
             
-            # 设置样式
-            border_color = "#888888" if color_str == "#FFFFFF" else "#333333"
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color_str};
-                    border: 1px solid {border_color};
-                    border-radius: 6px;
-                }}
-                QPushButton:hover {{
-                    border: 2px solid #000;
-                }}
-            """)
-            
-            # 连接点击事件
-            # 注意：在循环中使用 lambda 需要捕获变量
-            btn.clicked.connect(lambda checked, c=color_str: self._on_preset_color_clicked(c))
+            btn.clicked.connect(partial(self._on_preset_color_clicked, _PRESET_QCOLORS[color_str]))
             layout.addWidget(btn)
         
         layout.addStretch()
@@ -229,7 +255,8 @@ class TextSettingsPanel(QWidget):
     def _connect_signals(self):
         """连接内部信号"""
         self.font_combo.currentTextChanged.connect(self._on_font_changed)
-        self.size_spin.valueChanged.connect(self._on_font_changed)
+        # valueChanged 带 int 参数，直接连 start 会命中 start(msec) 重载把防抖间隔改成字号
+        self.size_spin.valueChanged.connect(lambda _v: self._size_timer.start())
         self.bold_btn.toggled.connect(self._on_font_changed)
         self.italic_btn.toggled.connect(self._on_font_changed)
         self.underline_btn.toggled.connect(self._on_font_changed)
@@ -246,9 +273,10 @@ class TextSettingsPanel(QWidget):
         self.current_color = color
         self.color_changed.emit(color)
 
-    def _on_preset_color_clicked(self, color_str):
+    def _on_preset_color_clicked(self, preset: QColor, _checked=False):
         """点击预设颜色"""
-        color = QColor(color_str)
+        # 复制一份再发出，避免接收方修改共享的预设颜色
+        color = QColor(preset)
         self.current_color = color
         self.color_btn.set_color(color)
         self.color_changed.emit(color)
@@ -320,7 +348,7 @@ class TextSettingsPanel(QWidget):
                     border: 2px solid #000;
                 }}
             """)
-            btn.clicked.connect(lambda checked, c=color_hex: self._on_background_preset_color(c))
+            btn.clicked.connect(partial(self._on_background_preset_color, color_hex))
             colors_layout.addWidget(btn)
 
         popup_layout.addLayout(colors_layout)
@@ -389,16 +417,21 @@ class TextSettingsPanel(QWidget):
         self._emit_background_changed()
 
     def _pick_background_color(self):
-        from PySide6.QtWidgets import QColorDialog
-        dlg = QColorDialog(self.background_color, None)
-        dlg.setWindowTitle(self.tr("Background Color"))
-        dlg.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
+        dlg = self._background_color_dialog
+        if dlg is None:
+            from PySide6.QtWidgets import QColorDialog
+            dlg = QColorDialog(None)
+            dlg.setWindowTitle(self.tr("Background Color"))
+            dlg.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
+            self.destroyed.connect(dlg.deleteLater)
+            self._background_color_dialog = dlg
+        dlg.setCurrentColor(self.background_color)
         if dlg.exec():
             self.background_color = dlg.selectedColor()
             self._update_background_color_btn()
             self._emit_background_changed()
 
-    def _on_background_preset_color(self, color_hex: str):
+    def _on_background_preset_color(self, color_hex: str, _checked=False):
         self.background_color = QColor(color_hex)
         self._update_background_color_btn()
         self._emit_background_changed()
@@ -496,15 +529,46 @@ class TextSettingsPanel(QWidget):
             
     def _on_font_changed(self):
         """字体属性改变"""
-        font = QFont(self.font_combo.currentText())
+        if self._applying_state:
+            return
+        # 直接触发时已读取最新字号，挂起的字号防抖不再需要
+        self._size_timer.stop()
+        family = self.font_combo.currentText()
+        # 字号/样式变化时复制当前字体（隐式共享，无需重新匹配字体族）；
+        # 只有切换字体族才按名称新建 QFont。不能原地修改，接收方可能持有上次发出的对象
+        if family == self.current_font.family():
+            font = QFont(self.current_font)
+        else:
+            font = QFont(family)
         font.setPointSize(max(1, self.size_spin.value()))
         font.setBold(self.bold_btn.isChecked())
         font.setItalic(self.italic_btn.isChecked())
         font.setUnderline(self.underline_btn.isChecked())
+        # 字体实际没变（如字号来回调整后回到原值）时不发信号，避免接收方重复排版和写配置
+        if font == self.current_font:
+            return
         
         self.current_font = font
         self.font_changed.emit(font)
         
+    def _apply_font_to_controls(self, font: QFont):
+        """把字体同步到各控件，只在最后重建并发出一次字体（逐个设置控件时跳过 _on_font_changed）"""
+        self._applying_state = True
+        try:
+            self.font_combo.setCurrentText(font.family())
+            point_size = font.pointSize()
+            if point_size <= 0:
+                point_size = int(round(font.pointSizeF())) if font.pointSizeF() > 0 else 16
+            self.size_spin.setValue(max(1, point_size))
+            self.bold_btn.setChecked(font.bold())
+            self.italic_btn.setChecked(font.italic())
+            self.underline_btn.setChecked(font.underline())
+        finally:
+            # 中途出错也要复位，否则面板之后再也不会发出字体变化
+            self._applying_state = False
+        # 同时取消挂起的字号防抖
+        self._on_font_changed()
+
     # 移除特效改变处理函数
     # def _on_effect_changed(self): ...
 
@@ -515,16 +579,8 @@ class TextSettingsPanel(QWidget):
         # 阻断信号防止循环触发
         self.blockSignals(True)
         
-        # 字体
-        font = item.font()
-        self.font_combo.setCurrentText(font.family())
-        point_size = font.pointSize()
-        if point_size <= 0:
-            point_size = int(round(font.pointSizeF())) if font.pointSizeF() > 0 else 16
-        self.size_spin.setValue(max(1, point_size))
-        self.bold_btn.setChecked(font.bold())
-        self.italic_btn.setChecked(font.italic())
-        self.underline_btn.setChecked(font.underline())
+        # 字体（信号仍被阻断，不会发出 font_changed）
+        self._apply_font_to_controls(item.font())
 
         # 背景
         self.background_enabled = getattr(item, "has_background", False)
@@ -582,14 +638,7 @@ class TextSettingsPanel(QWidget):
             font.setUnderline(text_settings.get("font_underline", False))
             color = QColor(text_settings.get("color", "#FF0000"))
 
-            self.font_combo.setCurrentText(font.family())
-            point_size = font.pointSize()
-            if point_size <= 0:
-                point_size = int(round(font.pointSizeF())) if font.pointSizeF() > 0 else 16
-            self.size_spin.setValue(max(1, point_size))
-            self.bold_btn.setChecked(font.bold())
-            self.italic_btn.setChecked(font.italic())
-            self.underline_btn.setChecked(font.underline())
+            self._apply_font_to_controls(font)
             self.current_color = color
             self.color_btn.set_color(color)
 
@@ -51,6 +51,11 @@ USE_FIXED_ILLUS_HEIGHT = True  # True: 固定高度；False: 使用比例 stretc
 class ToggleSwitch(QWidget):
     toggled = Signal(bool)
 
+    # 绘制用颜色只解析一次，动画每帧直接复用
+    _TRACK_ON = QColor(ACCENT)
+    _TRACK_OFF = QColor("#E5E5E5")
+    _KNOB = QColor("#FFFFFF")
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(44, 24)
@@ -85,6 +90,10 @@ class ToggleSwitch(QWidget):
         target = (self.width() - 21.0) if checked else 3.0
 
         self._anim.stop()
+        if not self.isVisible():
+            # 页面构建时的初始赋值无需补间，直接落位
+            self._set_cp(target)
+            return
         self._anim.setStartValue(self._circle_pos)
         self._anim.setEndValue(target)
         self._anim.start()
@@ -106,12 +115,12 @@ class ToggleSwitch(QWidget):
 
         # 轨道
         p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(QColor(ACCENT if self._checked else "#E5E5E5"))
+        p.setBrush(self._TRACK_ON if self._checked else self._TRACK_OFF)
         p.drawRoundedRect(0, 0, r.width(), h, h / 2, h / 2)
 
         # 圆圈
         cx = int(self._circle_pos)
-        p.setBrush(QColor("#FFFFFF"))
+        p.setBrush(self._KNOB)
         p.drawEllipse(cx, 3, 18, 18)
 
 